@@ -6,9 +6,9 @@ Main entry point and Overview page for the analytics dashboard.
 """
 
 import streamlit as st
-import pandas as pd
 import plotly.express as px
-from pathlib import Path
+import plotly.graph_objects as go
+from utils.data import get_df, platform_totals, PLATFORM_COLS
 
 # Page config
 st.set_page_config(
@@ -18,17 +18,18 @@ st.set_page_config(
     initial_sidebar_state="expanded",
 )
 
-# Load data
-@st.cache_data
-def load_data():
-    """Load the cleaned dataset."""
-    data_path = Path("data/processed/v1/smmh_clean.csv")
-    df = pd.read_csv(data_path)
-    # Filter to social media users only
-    df = df[df["include_in_analysis"] == True].copy()
-    return df
+# Columns used on this page
+PAGE_COLS = (
+    "daily_hours_midpoint",
+    "platform_count",
+    "daily_time_band",
+    "age_band",
+    "gender_grouped",
+    "occupation_status",
+    *PLATFORM_COLS,
+)
 
-df = load_data()
+df = get_df(PAGE_COLS)
 
 # Header
 st.title("Social Media & Mental Wellbeing Insights")
@@ -58,7 +59,8 @@ with col3:
     st.metric("Avg Platforms Used", f"{avg_platforms:.1f}")
 
 with col4:
-    pct_high_use = (df["daily_time_band"].isin(["Between 4 and 5 hours", "More than 5 hours"])).mean() * 100
+    # Codes 4 and 5 are "Between 4 and 5 hours" and "More than 5 hours"
+    pct_high_use = (df["daily_time_band"].cat.codes >= 4).mean() * 100
     st.metric("High Usage (4+ hrs)", f"{pct_high_use:.0f}%")
 
 st.divider()
@@ -69,25 +71,15 @@ col_left, col_right = st.columns(2)
 with col_left:
     st.subheader("Daily Time Spent on Social Media")
 
-    # Order the time bands properly
-    time_order = [
-        "Less than an Hour",
-        "Between 1 and 2 hours",
-        "Between 2 and 3 hours",
-        "Between 3 and 4 hours",
-        "Between 4 and 5 hours",
-        "More than 5 hours",
-    ]
-
-    time_counts = df["daily_time_band"].value_counts().reindex(time_order).reset_index()
-    time_counts.columns = ["Time Band", "Count"]
+    # Categories are already in time order
+    time_counts = df["daily_time_band"].value_counts(sort=False)
 
     fig_time = px.bar(
-        time_counts,
-        x="Time Band",
-        y="Count",
-        color="Count",
+        x=time_counts.index,
+        y=time_counts.values,
+        color=time_counts.values,
         color_continuous_scale="Blues",
+        labels={"x": "Time Band", "y": "Count", "color": "Count"},
     )
     fig_time.update_layout(
         showlegend=False,
@@ -102,19 +94,17 @@ with col_left:
 with col_right:
     st.subheader("Platform Usage")
 
-    # Calculate platform usage
-    platform_cols = [col for col in df.columns if col.startswith("platform_") and col != "platform_count"]
-    platform_usage = {col.replace("platform_", "").title(): df[col].sum() for col in platform_cols}
-    platform_df = pd.DataFrame(list(platform_usage.items()), columns=["Platform", "Users"])
-    platform_df = platform_df.sort_values("Users", ascending=True)
+    # Calculate platform usage (nine column sums: cheaper than hashing the
+    # frame to cache them)
+    platform_users = platform_totals(df)
 
     fig_platform = px.bar(
-        platform_df,
-        x="Users",
-        y="Platform",
+        x=platform_users.values,
+        y=platform_users.index,
         orientation="h",
-        color="Users",
+        color=platform_users.values,
         color_continuous_scale="Greens",
+        labels={"x": "Users", "y": "Platform", "color": "Users"},
     )
     fig_platform.update_layout(
         showlegend=False,
@@ -134,45 +124,41 @@ col_demo1, col_demo2, col_demo3 = st.columns(3)
 
 with col_demo1:
     st.markdown("**Age Distribution**")
-    age_order = ["<18", "18-24", "25-34", "35-44", "45+"]
-    age_counts = df["age_band"].value_counts().reindex(age_order).reset_index()
-    age_counts.columns = ["Age Band", "Count"]
-
-    fig_age = px.pie(
-        age_counts,
-        values="Count",
-        names="Age Band",
-        color_discrete_sequence=px.colors.sequential.Blues_r,
-    )
-    fig_age.update_layout(height=280)
+    age_counts = df["age_band"].value_counts(sort=False).drop("Unknown")
+
+    fig_age = go.Figure(go.Pie(
+        labels=age_counts.index,
+        values=age_counts.values,
+        marker_colors=px.colors.sequential.Blues_r,
+        hovertemplate="Age Band=%{label}<br>Count=%{value}<extra></extra>",
+    ))
+    fig_age.update_layout(height=280, margin_t=60)
     st.plotly_chart(fig_age, use_container_width=True)
 
 with col_demo2:
     st.markdown("**Gender Distribution**")
-    gender_counts = df["gender_grouped"].value_counts().reset_index()
-    gender_counts.columns = ["Gender", "Count"]
-
-    fig_gender = px.pie(
-        gender_counts,
-        values="Count",
-        names="Gender",
-        color_discrete_sequence=px.colors.sequential.Purples_r,
-    )
-    fig_gender.update_layout(height=280)
+    gender_counts = df["gender_grouped"].value_counts()
+
+    fig_gender = go.Figure(go.Pie(
+        labels=gender_counts.index,
+        values=gender_counts.values,
+        marker_colors=px.colors.sequential.Purples_r,
+        hovertemplate="Gender=%{label}<br>Count=%{value}<extra></extra>",
+    ))
+    fig_gender.update_layout(height=280, margin_t=60)
     st.plotly_chart(fig_gender, use_container_width=True)
 
 with col_demo3:
     st.markdown("**Occupation Status**")
-    occ_counts = df["occupation_status"].value_counts().reset_index()
-    occ_counts.columns = ["Occupation", "Count"]
-
-    fig_occ = px.pie(
-        occ_counts,
-        values="Count",
-        names="Occupation",
-        color_discrete_sequence=px.colors.sequential.Oranges_r,
-    )
-    fig_occ.update_layout(height=280)
+    occ_counts = df["occupation_status"].value_counts()
+
+    fig_occ = go.Figure(go.Pie(
+        labels=occ_counts.index,
+        values=occ_counts.values,
+        marker_colors=px.colors.sequential.Oranges_r,
+        hovertemplate="Occupation=%{label}<br>Count=%{value}<extra></extra>",
+    ))
+    fig_occ.update_layout(height=280, margin_t=60)
     st.plotly_chart(fig_occ, use_container_width=True)
 
 st.info("""
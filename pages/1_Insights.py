@@ -17,15 +17,13 @@ st.set_page_config(
     layout="wide",
 )
 
-# Load data
+# Load precomputed aggregates (built by src/build_aggregates.py)
 @st.cache_data
-def load_data():
-    data_path = Path("data/processed/v1/smmh_clean.csv")
-    df = pd.read_csv(data_path)
-    df = df[df["include_in_analysis"] == True].copy()
-    return df
+def load_aggregates():
+    aggregates_path = Path("reports/insight_aggregates.parquet")
+    return pd.read_parquet(aggregates_path, engine="pyarrow")
 
-df = load_data()
+aggregates = load_aggregates()
 
 # Header
 st.title("Key Insights")
@@ -42,23 +40,16 @@ st.subheader("1. Social Comparison is Strongly Linked to Low Mood")
 col1, col2 = st.columns([2, 1])
 
 with col1:
-    # Create binned comparison chart
-    df["comparison_level"] = pd.cut(
-        df["compare_to_successful"],
-        bins=[0, 2, 3, 5],
-        labels=["Low (1-2)", "Medium (3)", "High (4-5)"],
-    )
-
-    comparison_mood = df.groupby("comparison_level", observed=True)["low_mood_freq"].mean().reset_index()
-    comparison_mood.columns = ["Comparison Level", "Avg Low Mood Score"]
+    # Binned comparison chart
+    comparison_mood = aggregates[aggregates["chart"] == "comparison_mood"]
 
     fig1 = px.bar(
-        comparison_mood,
-        x="Comparison Level",
-        y="Avg Low Mood Score",
-        color="Avg Low Mood Score",
+        x=comparison_mood["level"].values,
+        y=comparison_mood["avg_low_mood"].values,
+        color=comparison_mood["avg_low_mood"].values,
         color_continuous_scale="Reds",
-        text=comparison_mood["Avg Low Mood Score"].round(2),
+        text=comparison_mood["avg_low_mood"].round(2).values,
+        labels={"x": "Comparison Level", "y": "Avg Low Mood Score", "color": "Avg Low Mood Score"},
     )
     fig1.update_layout(
         yaxis_range=[0, 5],
@@ -105,22 +96,15 @@ with col1:
     """)
 
 with col2:
-    df["purposeless_level"] = pd.cut(
-        df["purposeless_use"],
-        bins=[0, 2, 3, 5],
-        labels=["Low (1-2)", "Medium (3)", "High (4-5)"],
-    )
-
-    purposeless_mood = df.groupby("purposeless_level", observed=True)["low_mood_freq"].mean().reset_index()
-    purposeless_mood.columns = ["Purposeless Use Level", "Avg Low Mood Score"]
+    purposeless_mood = aggregates[aggregates["chart"] == "purposeless_mood"]
 
     fig2 = px.bar(
-        purposeless_mood,
-        x="Purposeless Use Level",
-        y="Avg Low Mood Score",
-        color="Avg Low Mood Score",
+        x=purposeless_mood["level"].values,
+        y=purposeless_mood["avg_low_mood"].values,
+        color=purposeless_mood["avg_low_mood"].values,
         color_continuous_scale="Oranges",
-        text=purposeless_mood["Avg Low Mood Score"].round(2),
+        text=purposeless_mood["avg_low_mood"].round(2).values,
+        labels={"x": "Purposeless Use Level", "y": "Avg Low Mood Score", "color": "Avg Low Mood Score"},
     )
     fig2.update_layout(
         yaxis_range=[0, 5],
@@ -136,27 +120,16 @@ st.divider()
 # Insight 3: Time Spent
 st.subheader("3. More Time on Social Media = Higher Low Mood (On Average)")
 
-time_order = [
-    "Less than an Hour",
-    "Between 1 and 2 hours",
-    "Between 2 and 3 hours",
-    "Between 3 and 4 hours",
-    "Between 4 and 5 hours",
-    "More than 5 hours",
-]
-
-time_mood = df.groupby("daily_time_band")["low_mood_freq"].agg(["mean", "count"]).reset_index()
-time_mood.columns = ["Time Band", "Avg Low Mood", "Count"]
-time_mood["Time Band"] = pd.Categorical(time_mood["Time Band"], categories=time_order, ordered=True)
-time_mood = time_mood.sort_values("Time Band")
+# Rows are already in time band order
+time_mood = aggregates[aggregates["chart"] == "time_mood"]
 
 fig3 = px.bar(
-    time_mood,
-    x="Time Band",
-    y="Avg Low Mood",
-    color="Avg Low Mood",
+    x=time_mood["level"].values,
+    y=time_mood["avg_low_mood"].values,
+    color=time_mood["avg_low_mood"].values,
     color_continuous_scale="Blues",
-    text=time_mood["Avg Low Mood"].round(2),
+    text=time_mood["avg_low_mood"].round(2).values,
+    labels={"x": "Time Band", "y": "Avg Low Mood", "color": "Avg Low Mood"},
 )
 fig3.update_layout(
     yaxis_range=[0, 5],
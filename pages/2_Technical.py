@@ -9,9 +9,9 @@ import streamlit as st
 import pandas as pd
 import numpy as np
 import plotly.express as px
-import plotly.graph_objects as go
-from scipy import stats
 from pathlib import Path
+from utils.data import get_df
+from utils.charts import quartile_box_figure
 
 st.set_page_config(
     page_title="Technical | SM & Mental Wellbeing",
@@ -19,15 +19,77 @@ st.set_page_config(
     layout="wide",
 )
 
-# Load data
+# Columns used on this page
+PAGE_COLS = (
+    "daily_time_band",
+    "low_mood_freq",
+    "purposeless_use",
+    "compare_to_successful",
+    "seek_validation",
+    "restless_without_sm",
+    "sleep_issues",
+)
+
+# Spearman hypotheses: (ID, predictor, outcome)
+SPEARMAN_TESTS = [
+    ("H2", "purposeless_use", "low_mood_freq"),
+    ("H3", "compare_to_successful", "low_mood_freq"),
+    ("H4", "seek_validation", "low_mood_freq"),
+    ("H5", "restless_without_sm", "sleep_issues"),
+]
+
+# Load precomputed correlation matrix (built by src/build_aggregates.py)
+@st.cache_data
+def load_corr_matrix():
+    corr_path = Path("reports/corr_matrix.parquet")
+    return pd.read_parquet(corr_path, engine="pyarrow")
+
+def interpret_rho(rho):
+    if abs(rho) < 0.10:
+        return "Negligible"
+    elif abs(rho) < 0.30:
+        return "Small"
+    elif abs(rho) < 0.50:
+        return "Moderate"
+    return "Large"
+
+def interpret_epsilon(eps):
+    if eps < 0.01:
+        return "Negligible"
+    elif eps < 0.06:
+        return "Small"
+    elif eps < 0.14:
+        return "Moderate"
+    return "Large"
+
+# Run the hypothesis tests once per dataset
 @st.cache_data
-def load_data():
-    data_path = Path("data/processed/v1/smmh_clean.csv")
-    df = pd.read_csv(data_path)
-    df = df[df["include_in_analysis"] == True].copy()
-    return df
+def run_tests(df):
+    """Return {ID: (statistic, p-value, effect size label)} for H1-H5."""
+    # Imported here so scipy only loads when the tests actually run
+    from scipy import stats
+
+    groups = [g["low_mood_freq"].values for _, g in df.groupby("daily_time_band", observed=True, sort=False)]
+    h_stat, h_p = stats.kruskal(*groups)
+    results = {"H1": (h_stat, h_p, interpret_epsilon(h_stat / (len(df) - 1)))}
+
+    for test_id, predictor, outcome in SPEARMAN_TESTS:
+        rho, p = stats.spearmanr(df[predictor], df[outcome])
+        results[test_id] = (rho, p, interpret_rho(rho))
+
+    return results
 
-df = load_data()
+def format_p(p):
+    return "< 0.001" if p < 0.001 else f"{p:.3f}"
+
+# Fixed-seed scatter jitter, drawn once per row count
+@st.cache_data
+def jittered(n, seed=0):
+    rng = np.random.default_rng(seed)
+    return rng.uniform(-0.2, 0.2, n).astype(np.float32), rng.uniform(-0.2, 0.2, n).astype(np.float32)
+
+df = get_df(PAGE_COLS)
+tests = run_tests(df)
 
 # Header
 st.title("Technical Analysis")
@@ -41,9 +103,18 @@ st.divider()
 # Hypothesis Tests Summary
 st.subheader("Hypothesis Test Results")
 
-st.markdown("""
+# Summarise from the computed p-values so the text can't contradict the table
+n_significant = sum(p < 0.05 for _, p, _ in tests.values())
+if n_significant == len(tests):
+    significance_summary = "All tests found statistically significant associations."
+elif n_significant == 0:
+    significance_summary = "No test found a statistically significant association."
+else:
+    significance_summary = f"{n_significant} of {len(tests)} tests found statistically significant associations."
+
+st.markdown(f"""
 We tested five pre-registered hypotheses about associations between social media behaviours
-and wellbeing indicators. All tests found statistically significant associations.
+and wellbeing indicators. {significance_summary}
 """)
 
 # Create results table
@@ -70,10 +141,13 @@ test_results = pd.DataFrame({
         "Spearman rho",
         "Spearman rho",
     ],
-    "Statistic": ["H = 53.7", "rho = 0.29", "rho = 0.40", "rho = 0.26", "rho = 0.16"],
-    "p-value": ["< 0.001", "< 0.001", "< 0.001", "< 0.001", "< 0.001"],
-    "Effect Size": ["Moderate", "Small", "Moderate", "Small", "Small"],
-    "Significant": ["Yes", "Yes", "Yes", "Yes", "Yes"],
+    "Statistic": [
+        f"H = {stat:.1f}" if test_id == "H1" else f"rho = {stat:.2f}"
+        for test_id, (stat, _, _) in tests.items()
+    ],
+    "p-value": [format_p(p) for _, p, _ in tests.values()],
+    "Effect Size": [effect for _, _, effect in tests.values()],
+    "Significant": ["Yes" if p < 0.05 else "No" for _, p, _ in tests.values()],
 })
 
 st.dataframe(test_results, use_container_width=True, hide_index=True)
@@ -86,7 +160,7 @@ st.subheader("Understanding Effect Sizes")
 col1, col2 = st.columns(2)
 
 with col1:
-    st.markdown("""
+    st.markdown(f"""
     **Spearman's rho interpretation (Cohen's guidelines):**
 
     | rho | Interpretation |
@@ -95,8 +169,8 @@ with col1:
     | 0.30 - 0.49 | Moderate |
     | 0.50+ | Large |
 
-    The strongest association (H3: comparison → low mood) has rho = 0.40,
-    which is a **moderate** effect size.
+    The strongest association (H3: comparison → low mood) has rho = {tests['H3'][0]:.2f},
+    which is a **{tests['H3'][2].lower()}** effect size.
     """)
 
 with col2:
@@ -114,29 +188,8 @@ st.divider()
 # Correlation Matrix
 st.subheader("Correlation Matrix: Behaviour vs Wellbeing")
 
-behaviour_cols = [
-    "purposeless_use",
-    "distracted_when_busy",
-    "restless_without_sm",
-    "compare_to_successful",
-    "seek_validation",
-]
-
-wellbeing_cols = [
-    "low_mood_freq",
-    "sleep_issues",
-    "worries_bother",
-    "difficulty_concentrating",
-    "interest_fluctuation",
-]
-
-# Calculate Spearman correlations
-corr_matrix = pd.DataFrame(index=behaviour_cols, columns=wellbeing_cols, dtype=float)
-
-for b_col in behaviour_cols:
-    for w_col in wellbeing_cols:
-        rho, _ = stats.spearmanr(df[b_col], df[w_col])
-        corr_matrix.loc[b_col, w_col] = rho
+# Spearman correlations (precomputed offline)
+corr_matrix = load_corr_matrix()
 
 # Clean up labels
 corr_matrix.index = [
@@ -180,23 +233,8 @@ st.subheader("Deep Dive: Daily Time vs Low Mood (H1)")
 col1, col2 = st.columns([2, 1])
 
 with col1:
-    time_order = [
-        "Less than an Hour",
-        "Between 1 and 2 hours",
-        "Between 2 and 3 hours",
-        "Between 3 and 4 hours",
-        "Between 4 and 5 hours",
-        "More than 5 hours",
-    ]
-
-    fig_box = px.box(
-        df,
-        x="daily_time_band",
-        y="low_mood_freq",
-        category_orders={"daily_time_band": time_order},
-        color="daily_time_band",
-        color_discrete_sequence=px.colors.sequential.Blues,
-    )
+    # Five-number summary per band; only these numbers go to the browser
+    fig_box = quartile_box_figure(df, "daily_time_band", "low_mood_freq", px.colors.sequential.Blues)
     fig_box.update_layout(
         xaxis_tickangle=-45,
         showlegend=False,
@@ -207,14 +245,14 @@ with col1:
     st.plotly_chart(fig_box, use_container_width=True)
 
 with col2:
-    st.markdown("""
+    st.markdown(f"""
     **Test details:**
 
     - **Test:** Kruskal-Wallis H
     - **Why:** Non-parametric; doesn't assume normality
-    - **H statistic:** 53.7
-    - **p-value:** < 0.001
-    - **Conclusion:** Significant differences in low mood across time bands
+    - **H statistic:** {tests['H1'][0]:.1f}
+    - **p-value:** {format_p(tests['H1'][1])}
+    - **Conclusion:** {"Significant" if tests['H1'][1] < 0.05 else "No significant"} differences in low mood across time bands
 
     **Post-hoc observation:**
 
@@ -230,20 +268,20 @@ st.subheader("Deep Dive: Social Comparison vs Low Mood (H3)")
 col1, col2 = st.columns([2, 1])
 
 with col1:
-    # Add jitter for visibility
-    df_plot = df.copy()
-    df_plot["compare_jitter"] = df_plot["compare_to_successful"] + np.random.uniform(-0.2, 0.2, len(df_plot))
-    df_plot["mood_jitter"] = df_plot["low_mood_freq"] + np.random.uniform(-0.2, 0.2, len(df_plot))
+    # Add jitter for visibility (plain float32 arrays, no frame copy)
+    jitter_x, jitter_y = jittered(len(df))
+    compare_jitter = df["compare_to_successful"].to_numpy(np.float32) + jitter_x
+    mood_jitter = df["low_mood_freq"].to_numpy(np.float32) + jitter_y
 
     fig_scatter = px.scatter(
-        df_plot,
-        x="compare_jitter",
-        y="mood_jitter",
+        x=compare_jitter,
+        y=mood_jitter,
         opacity=0.5,
         trendline="ols",
+        render_mode="webgl",
         labels={
-            "compare_jitter": "Compare to Successful (1-5)",
-            "mood_jitter": "Low Mood Frequency (1-5)",
+            "x": "Compare to Successful (1-5)",
+            "y": "Low Mood Frequency (1-5)",
         },
     )
     fig_scatter.update_layout(height=400)
@@ -251,14 +289,14 @@ with col1:
     st.plotly_chart(fig_scatter, use_container_width=True)
 
 with col2:
-    st.markdown("""
+    st.markdown(f"""
     **Test details:**
 
     - **Test:** Spearman correlation
     - **Why:** Ordinal data; robust to outliers
-    - **rho:** 0.40
-    - **p-value:** < 0.001
-    - **Effect size:** Moderate
+    - **rho:** {tests['H3'][0]:.2f}
+    - **p-value:** {format_p(tests['H3'][1])}
+    - **Effect size:** {tests['H3'][2]}
 
     **Interpretation:**
 
@@ -11,7 +11,8 @@ import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
 from scipy import stats
-from pathlib import Path
+from utils.data import get_df, platform_totals, PLATFORM_COLS, TIME_ORDER
+from utils.charts import quartile_box_figure
 
 st.set_page_config(
     page_title="Dashboard | SM & Mental Wellbeing",
@@ -19,15 +20,138 @@ st.set_page_config(
     layout="wide",
 )
 
-# Load data
+# Columns used on this page
+PAGE_COLS = (
+    "age_band",
+    "gender_grouped",
+    "daily_time_band",
+    "occupation_status",
+    "daily_hours_midpoint",
+    "purposeless_use",
+    "distracted_when_busy",
+    "restless_without_sm",
+    "compare_to_successful",
+    "seek_validation",
+    "low_mood_freq",
+    "sleep_issues",
+    "worries_bother",
+    "difficulty_concentrating",
+    *PLATFORM_COLS,
+)
+
+BEHAVIOUR_COLS = [
+    "purposeless_use",
+    "distracted_when_busy",
+    "restless_without_sm",
+    "compare_to_successful",
+    "seek_validation",
+]
+
+WELLBEING_COLS = [
+    "low_mood_freq",
+    "sleep_issues",
+    "worries_bother",
+    "difficulty_concentrating",
+]
+
+# Sidebar filters, in selectbox order
+FILTER_COLS = ("age_band", "gender_grouped", "daily_time_band", "occupation_status")
+
+def filter_positions(data, selections):
+    """Positions of rows matching every non-"All" selection, for slicing column arrays."""
+    masks = [(data[col] == value).to_numpy() for col, value in zip(FILTER_COLS, selections) if value != "All"]
+    return np.flatnonzero(np.logical_and.reduce(masks)) if masks else np.arange(len(data))
+
+# Filter-dependent aggregates, memoised per filter combination so returning
+# to an earlier selection skips the recompute
+@st.cache_data(max_entries=64)
+def compute_panels(age, gender, time, occupation):
+    data = get_df(PAGE_COLS)
+    rows = filter_positions(data, (age, gender, time, occupation))
+
+    # Spearman rho only: rank each column once and correlate the ranks,
+    # skipping the p-values spearmanr would also compute
+    if len(rows) >= 10:
+        ranks = stats.rankdata(data[BEHAVIOUR_COLS + WELLBEING_COLS].to_numpy()[rows], axis=0)
+        rho = np.corrcoef(ranks, rowvar=False)
+        corr = rho[:len(BEHAVIOUR_COLS), len(BEHAVIOUR_COLS):]
+    else:
+        corr = np.full((len(BEHAVIOUR_COLS), len(WELLBEING_COLS)), np.nan)
+
+    # Counts for scores 1-5 of both Likert columns in one bincount:
+    # offset each column's scores into its own block of 6 bins
+    scores = data[["low_mood_freq", "compare_to_successful"]].to_numpy()[rows].astype(np.intp)
+    counts = np.bincount((scores + [0, 6]).ravel(), minlength=12).reshape(2, 6)[:, 1:]
+
+    return {
+        "corr": corr,
+        # One column-wise sum over all platform flags
+        "platform": platform_totals(data, rows),
+        "mood_counts": counts[0],
+        "comp_counts": counts[1],
+    }
+
+# Scatter jitter drawn once for the full dataset; rows index into it, so a
+# point keeps the same offset whatever the filters
 @st.cache_data
-def load_data():
-    data_path = Path("data/processed/v1/smmh_clean.csv")
-    df = pd.read_csv(data_path)
-    df = df[df["include_in_analysis"] == True].copy()
-    return df
+def jitter_buffer(n, seed=0):
+    return np.random.default_rng(seed).uniform(-0.15, 0.15, (n, 4)).astype(np.float32)
+
+# Above this many rows the scatters switch to counts over the 5x5 Likert grid
+DENSITY_MIN_ROWS = 1000
+
+def relationship_figure(x, y, jitter_x, jitter_y, colour, scale):
+    """Jittered scatter for small samples, 5x5 count heatmap for large ones."""
+    if len(x) > DENSITY_MIN_ROWS:
+        # Only the 25 cell counts go to the browser
+        cells = (x.astype(np.intp) - 1) * 5 + (y.astype(np.intp) - 1)
+        counts = np.bincount(cells, minlength=25).reshape(5, 5)
+        fig = go.Figure(go.Heatmap(
+            x=np.arange(1, 6),
+            y=np.arange(1, 6),
+            z=counts.T,
+            colorscale=scale,
+            colorbar_title="Count",
+        ))
+
+        # Least-squares trend line over the unjittered scores
+        slope, intercept = np.polyfit(x, y, 1)
+        fig.add_trace(go.Scatter(
+            x=[1, 5],
+            y=[slope + intercept, 5 * slope + intercept],
+            mode="lines",
+            line_color=colour,
+            hoverinfo="skip",
+            showlegend=False,
+        ))
+        return fig
+
+    # Plain arrays straight into a WebGL trace, no DataFrame round trip
+    x_plot = x + jitter_x
+    y_plot = y + jitter_y
+    fig = go.Figure(go.Scattergl(
+        x=x_plot,
+        y=y_plot,
+        mode="markers",
+        marker=dict(size=8, color=colour, opacity=0.6),
+        showlegend=False,
+    ))
+
+    # Least-squares trend line through the plotted points
+    if len(x) >= 10:
+        slope, intercept = np.polyfit(x_plot, y_plot, 1)
+        fig.add_trace(go.Scatter(
+            x=[x_plot.min(), x_plot.max()],
+            y=[slope * x_plot.min() + intercept, slope * x_plot.max() + intercept],
+            mode="lines",
+            line_color=colour,
+            hoverinfo="skip",
+            showlegend=False,
+        ))
+    return fig
 
-df = load_data()
+# Load data
+df = get_df(PAGE_COLS)
 
 # Header
 st.title("Interactive Dashboard")
@@ -47,15 +171,7 @@ gender_options = ["All"] + sorted(df["gender_grouped"].unique().tolist())
 selected_gender = st.sidebar.selectbox("Gender", gender_options)
 
 # Time band filter
-time_order = [
-    "Less than an Hour",
-    "Between 1 and 2 hours",
-    "Between 2 and 3 hours",
-    "Between 3 and 4 hours",
-    "Between 4 and 5 hours",
-    "More than 5 hours",
-]
-time_options = ["All"] + time_order
+time_options = ["All"] + TIME_ORDER
 selected_time = st.sidebar.selectbox("Daily Time Spent", time_options)
 
 # Occupation filter
@@ -63,52 +179,44 @@ occupation_options = ["All"] + sorted(df["occupation_status"].unique().tolist())
 selected_occupation = st.sidebar.selectbox("Occupation", occupation_options)
 
 # Apply filters
-df_filtered = df.copy()
-
-if selected_age != "All":
-    df_filtered = df_filtered[df_filtered["age_band"] == selected_age]
-
-if selected_gender != "All":
-    df_filtered = df_filtered[df_filtered["gender_grouped"] == selected_gender]
-
-if selected_time != "All":
-    df_filtered = df_filtered[df_filtered["daily_time_band"] == selected_time]
-
-if selected_occupation != "All":
-    df_filtered = df_filtered[df_filtered["occupation_status"] == selected_occupation]
+selections = (selected_age, selected_gender, selected_time, selected_occupation)
+rows = filter_positions(df, selections)
+n_rows = len(rows)
 
 # Show filter summary
 st.sidebar.divider()
-st.sidebar.metric("Filtered Sample Size", f"{len(df_filtered):,}")
+st.sidebar.metric("Filtered Sample Size", f"{n_rows:,}")
 
-if len(df_filtered) < 30:
+if n_rows < 30:
     st.sidebar.warning("Small sample size — interpret with caution")
 
 st.sidebar.divider()
 st.sidebar.markdown("**Reset filters** by selecting 'All' for each option.")
 
 # Main dashboard content
-if len(df_filtered) == 0:
+if n_rows == 0:
     st.error("No data matches the selected filters. Please adjust your selections.")
 else:
+    panels = compute_panels(*selections)
+
     # Row 1: Key metrics for filtered data
     st.subheader("Summary Metrics")
 
     col1, col2, col3, col4 = st.columns(4)
 
     with col1:
-        st.metric("Sample Size", f"{len(df_filtered):,}")
+        st.metric("Sample Size", f"{n_rows:,}")
 
     with col2:
-        avg_mood = df_filtered["low_mood_freq"].mean()
+        avg_mood = df["low_mood_freq"].to_numpy()[rows].mean()
         st.metric("Avg Low Mood Score", f"{avg_mood:.2f}")
 
     with col3:
-        avg_comparison = df_filtered["compare_to_successful"].mean()
+        avg_comparison = df["compare_to_successful"].to_numpy()[rows].mean()
         st.metric("Avg Comparison Score", f"{avg_comparison:.2f}")
 
     with col4:
-        avg_time = df_filtered["daily_hours_midpoint"].mean()
+        avg_time = df["daily_hours_midpoint"].to_numpy()[rows].mean()
         st.metric("Avg Daily Hours", f"{avg_time:.1f}h")
 
     st.divider()
@@ -121,35 +229,8 @@ else:
     with col1:
         st.markdown("**Correlation Heatmap**")
 
-        behaviour_cols = [
-            "purposeless_use",
-            "distracted_when_busy",
-            "restless_without_sm",
-            "compare_to_successful",
-            "seek_validation",
-        ]
-
-        wellbeing_cols = [
-            "low_mood_freq",
-            "sleep_issues",
-            "worries_bother",
-            "difficulty_concentrating",
-        ]
-
-        # Calculate correlations for filtered data
-        corr_data = []
-        for b_col in behaviour_cols:
-            row = []
-            for w_col in wellbeing_cols:
-                if len(df_filtered) >= 10:
-                    rho, _ = stats.spearmanr(df_filtered[b_col], df_filtered[w_col])
-                    row.append(rho)
-                else:
-                    row.append(np.nan)
-            corr_data.append(row)
-
         corr_matrix = pd.DataFrame(
-            corr_data,
+            panels["corr"],
             index=["Purposeless", "Distracted", "Restless", "Comparison", "Validation"],
             columns=["Low Mood", "Sleep", "Worries", "Concentration"],
         )
@@ -170,14 +251,12 @@ else:
     with col2:
         st.markdown("**Low Mood by Time Spent**")
 
-        if len(df_filtered["daily_time_band"].unique()) > 1:
-            fig_box = px.box(
-                df_filtered,
-                x="daily_time_band",
-                y="low_mood_freq",
-                category_orders={"daily_time_band": time_order},
-                color="daily_time_band",
-                color_discrete_sequence=px.colors.sequential.Blues,
+        box_data = df[["daily_time_band", "low_mood_freq"]].iloc[rows]
+
+        if box_data["daily_time_band"].nunique() > 1:
+            # Five-number summary per band; only these numbers go to the browser
+            fig_box = quartile_box_figure(
+                box_data, "daily_time_band", "low_mood_freq", px.colors.sequential.Blues
             )
             fig_box.update_layout(
                 xaxis_tickangle=-45,
@@ -195,52 +274,46 @@ else:
     # Row 3: Scatter plots
     st.subheader("Relationship Explorer")
 
+    # Columns: comparison, mood, purposeless, mood
+    jitter = jitter_buffer(len(df))[rows]
+    mood = df["low_mood_freq"].to_numpy(np.float32)[rows]
+
     col1, col2 = st.columns(2)
 
     with col1:
         st.markdown("**Social Comparison vs Low Mood**")
 
-        df_plot = df_filtered.copy()
-        df_plot["compare_jitter"] = df_plot["compare_to_successful"] + np.random.uniform(-0.15, 0.15, len(df_plot))
-        df_plot["mood_jitter"] = df_plot["low_mood_freq"] + np.random.uniform(-0.15, 0.15, len(df_plot))
-
-        fig_scatter1 = px.scatter(
-            df_plot,
-            x="compare_jitter",
-            y="mood_jitter",
-            opacity=0.6,
-            trendline="ols" if len(df_filtered) >= 10 else None,
-            color_discrete_sequence=["#e74c3c"],
+        fig_scatter1 = relationship_figure(
+            df["compare_to_successful"].to_numpy(np.float32)[rows],
+            mood,
+            jitter[:, 0],
+            jitter[:, 1],
+            colour="#e74c3c",
+            scale="Reds",
         )
         fig_scatter1.update_layout(
             height=320,
             xaxis_title="Comparison Frequency (1-5)",
             yaxis_title="Low Mood Frequency (1-5)",
         )
-        fig_scatter1.update_traces(marker=dict(size=8))
         st.plotly_chart(fig_scatter1, use_container_width=True)
 
     with col2:
         st.markdown("**Purposeless Use vs Low Mood**")
 
-        df_plot2 = df_filtered.copy()
-        df_plot2["purpose_jitter"] = df_plot2["purposeless_use"] + np.random.uniform(-0.15, 0.15, len(df_plot2))
-        df_plot2["mood_jitter"] = df_plot2["low_mood_freq"] + np.random.uniform(-0.15, 0.15, len(df_plot2))
-
-        fig_scatter2 = px.scatter(
-            df_plot2,
-            x="purpose_jitter",
-            y="mood_jitter",
-            opacity=0.6,
-            trendline="ols" if len(df_filtered) >= 10 else None,
-            color_discrete_sequence=["#3498db"],
+        fig_scatter2 = relationship_figure(
+            df["purposeless_use"].to_numpy(np.float32)[rows],
+            mood,
+            jitter[:, 2],
+            jitter[:, 3],
+            colour="#3498db",
+            scale="Blues",
         )
         fig_scatter2.update_layout(
             height=320,
             xaxis_title="Purposeless Use (1-5)",
             yaxis_title="Low Mood Frequency (1-5)",
         )
-        fig_scatter2.update_traces(marker=dict(size=8))
         st.plotly_chart(fig_scatter2, use_container_width=True)
 
     st.divider()
@@ -253,18 +326,15 @@ else:
     with col1:
         st.markdown("**Platform Usage**")
 
-        platform_cols = [col for col in df_filtered.columns if col.startswith("platform_") and col != "platform_count"]
-        platform_usage = {col.replace("platform_", "").title(): df_filtered[col].sum() for col in platform_cols}
-        platform_df = pd.DataFrame(list(platform_usage.items()), columns=["Platform", "Users"])
-        platform_df = platform_df.sort_values("Users", ascending=True)
+        platform_users = panels["platform"]
 
         fig_platform = px.bar(
-            platform_df,
-            x="Users",
-            y="Platform",
+            x=platform_users.values,
+            y=platform_users.index,
             orientation="h",
-            color="Users",
+            color=platform_users.values,
             color_continuous_scale="Greens",
+            labels={"x": "Users", "y": "Platform", "color": "Users"},
         )
         fig_platform.update_layout(
             showlegend=False,
@@ -276,15 +346,14 @@ else:
     with col2:
         st.markdown("**Low Mood Distribution**")
 
-        mood_counts = df_filtered["low_mood_freq"].value_counts().sort_index().reset_index()
-        mood_counts.columns = ["Score", "Count"]
+        mood_counts = panels["mood_counts"]
 
         fig_mood = px.bar(
-            mood_counts,
-            x="Score",
-            y="Count",
-            color="Count",
+            x=np.arange(1, 6),
+            y=mood_counts,
+            color=mood_counts,
             color_continuous_scale="Reds",
+            labels={"x": "Score", "y": "Count", "color": "Count"},
         )
         fig_mood.update_layout(
             showlegend=False,
@@ -297,15 +366,14 @@ else:
     with col3:
         st.markdown("**Comparison Distribution**")
 
-        comp_counts = df_filtered["compare_to_successful"].value_counts().sort_index().reset_index()
-        comp_counts.columns = ["Score", "Count"]
+        comp_counts = panels["comp_counts"]
 
         fig_comp = px.bar(
-            comp_counts,
-            x="Score",
-            y="Count",
-            color="Count",
+            x=np.arange(1, 6),
+            y=comp_counts,
+            color=comp_counts,
             color_continuous_scale="Purples",
+            labels={"x": "Score", "y": "Count", "color": "Count"},
         )
         fig_comp.update_layout(
             showlegend=False,
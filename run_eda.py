@@ -7,31 +7,21 @@ matplotlib.use('Agg')
 import matplotlib.pyplot as plt
 from scipy import stats
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+import os
 from datetime import datetime
+from utils.frames import to_numpy_ints
 import warnings
 warnings.filterwarnings("ignore")
 
-print("=" * 60)
-print("RUNNING: 02_EDA_and_Tests.ipynb")
-print("=" * 60)
-
 # Setup paths
 project_root = Path(__file__).parent
-data_path = project_root / "data" / "processed" / "v1" / "smmh_clean.csv"
+data_path = project_root / "data" / "processed" / "v1" / "smmh_clean_included.parquet"
 reports_path = project_root / "reports"
 figures_path = reports_path / "figures"
-figures_path.mkdir(parents=True, exist_ok=True)
-
-print(f"\n[Setup]")
-print(f"  Project root: {project_root}")
-print(f"  Data exists: {data_path.exists()}")
 
 COLORS = {'primary': '#2E86AB', 'secondary': '#A23B72', 'tertiary': '#F18F01', 'quaternary': '#C73E1D'}
-
-# Load data
-df_full = pd.read_csv(data_path)
-df = df_full[df_full["include_in_analysis"] == True].copy()
-print(f"  Loaded: {len(df)} rows for analysis")
+plt.rcParams.update({'figure.figsize': (10, 6), 'axes.spines.top': False, 'axes.spines.right': False})
 
 # Column definitions
 LIKERT_COLS = ["purposeless_use", "distracted_when_busy", "restless_without_sm",
@@ -46,16 +36,8 @@ BEHAVIOUR_COLS = ["purposeless_use", "distracted_when_busy", "restless_without_s
                   "compare_to_successful", "seek_validation"]
 TIME_BAND_ORDER = ["Less than an Hour", "Between 1 and 2 hours", "Between 2 and 3 hours",
                    "Between 3 and 4 hours", "Between 4 and 5 hours", "More than 5 hours"]
-
-df["daily_time_band"] = pd.Categorical(df["daily_time_band"], categories=TIME_BAND_ORDER, ordered=True)
-
-# Data quality
-print(f"\n[Data Quality]")
-print(f"  Shape: {df.shape}")
-print(f"  Duplicates: {df.duplicated().sum()}")
-for col in LIKERT_COLS:
-    assert df[col].min() >= 1 and df[col].max() <= 5, f"Likert fail: {col}"
-print(f"  Likert validation: PASS")
+TIME_BAND_LABELS = ["<1h", "1-2h", "2-3h", "3-4h", "4-5h", ">5h"]
+SEGMENT_COLS = ["age_band", "gender_grouped", "occupation_status"]
 
 # Helper functions
 def epsilon_squared(h_stat, n, k): return h_stat / (n - 1)
@@ -70,176 +52,264 @@ def interpret_epsilon(eps):
     elif eps < 0.14: return "moderate"
     else: return "large"
 
-def run_spearman(df, v1, v2):
-    data = df[[v1, v2]].dropna()
-    rho, p = stats.spearmanr(data[v1], data[v2])
-    return {"n": len(data), "statistic": rho, "p_value": p, "effect_size_name": "Spearman rho",
+def likert_ranks(values):
+    # Tied (average) ranks of 1-5 scores per column from a level count table, no sort:
+    # level v spans ranks cum[v-1]+1 .. cum[v], so its mid-rank is cum[v] - (count[v]-1)/2
+    codes = values.astype(np.intp) + 6 * np.arange(values.shape[1])
+    counts = np.bincount(codes.ravel(), minlength=6 * values.shape[1]).reshape(-1, 6)
+    mid_ranks = np.cumsum(counts, axis=1) - (counts - 1) / 2
+    return mid_ranks.ravel()[codes]
+
+def spearman_matrix(df, cols):
+    # With missing scores fall back to pandas' pairwise-complete Spearman
+    if df[cols].isna().any().any():
+        return df[cols].astype(float).corr(method="spearman")
+    # Rank each column once; Spearman rho is Pearson correlation of the ranks
+    ranks = likert_ranks(df[cols].to_numpy())
+    return pd.DataFrame(np.corrcoef(ranks, rowvar=False), index=cols, columns=cols)
+
+def run_spearman(corr, df, v1, v2):
+    rho = corr.loc[v1, v2]
+    n = int(df[[v1, v2]].notna().all(axis=1).sum())
+    # Two-sided p-value from the t-transform, as in scipy.stats.spearmanr
+    t = rho * np.sqrt((n - 2) / (1 - rho**2))
+    p = 2 * stats.t.sf(abs(t), n - 2)
+    return {"n": n, "statistic": rho, "p_value": p, "effect_size_name": "Spearman rho",
             "effect_size_value": rho, "interpretation": interpret_rho(rho)}
 
+def box_groups(df, group, outcome, levels):
+    # One groupby pass, then the outcome values for each requested level in order
+    groups = {k: g.dropna().values for k, g in df.groupby(group, observed=True)[outcome]}
+    return [groups.get(level, np.empty(0)) for level in levels]
+
+def level_stats(df, level_col, outcome):
+    # Per-level count, mean and sample std from three bincount passes (levels are small ints)
+    data = df[[level_col, outcome]].dropna()
+    levels = data[level_col].to_numpy(np.intp)
+    values = data[outcome].to_numpy(float)
+    counts = np.bincount(levels)
+    sums = np.bincount(levels, weights=values)
+    sq_sums = np.bincount(levels, weights=values * values)
+    observed = np.flatnonzero(counts)
+    n = counts[observed]
+    mean = sums[observed] / n
+    std = np.sqrt((sq_sums[observed] - n * mean**2) / (n - 1))
+    return observed, n, mean, std
+
 def run_kruskal(df, group, outcome):
     data = df[[group, outcome]].dropna()
-    groups = [g[outcome].values for _, g in data.groupby(group, observed=True) if len(g) > 0]
+    groups = [g[outcome].values for _, g in data.groupby(group, observed=True, sort=False) if len(g) > 0]
     h, p = stats.kruskal(*groups)
     eps = epsilon_squared(h, len(data), len(groups))
     return {"n": len(data), "statistic": h, "p_value": p, "effect_size_name": "epsilon_squared",
             "effect_size_value": eps, "interpretation": interpret_epsilon(eps)}
 
-# Hypothesis testing
-print(f"\n[Hypothesis Testing]")
-print("-" * 60)
-results = []
-
-h1 = run_kruskal(df, "daily_time_band", "low_mood_freq")
-print(f"H1 Time->Mood: H={h1['statistic']:.2f}, p={h1['p_value']:.2e}, {h1['interpretation']}")
-results.append({"hypothesis_id": "H1", "outcome": "low_mood_freq", "predictor": "daily_time_band", "test_used": "Kruskal-Wallis", **h1})
-
-h2 = run_spearman(df, "purposeless_use", "low_mood_freq")
-print(f"H2 Purposeless->Mood: rho={h2['statistic']:.2f}, p={h2['p_value']:.2e}, {h2['interpretation']}")
-results.append({"hypothesis_id": "H2", "outcome": "low_mood_freq", "predictor": "purposeless_use", "test_used": "Spearman", **h2})
-
-h3 = run_spearman(df, "compare_to_successful", "low_mood_freq")
-print(f"H3 Compare->Mood: rho={h3['statistic']:.2f}, p={h3['p_value']:.2e}, {h3['interpretation']}")
-results.append({"hypothesis_id": "H3", "outcome": "low_mood_freq", "predictor": "compare_to_successful", "test_used": "Spearman", **h3})
-
-h4 = run_spearman(df, "seek_validation", "low_mood_freq")
-print(f"H4 Validation->Mood: rho={h4['statistic']:.2f}, p={h4['p_value']:.2e}, {h4['interpretation']}")
-results.append({"hypothesis_id": "H4", "outcome": "low_mood_freq", "predictor": "seek_validation", "test_used": "Spearman", **h4})
-
-h5 = run_spearman(df, "restless_without_sm", "sleep_issues")
-print(f"H5 Restless->Sleep: rho={h5['statistic']:.2f}, p={h5['p_value']:.2e}, {h5['interpretation']}")
-results.append({"hypothesis_id": "H5", "outcome": "sleep_issues", "predictor": "restless_without_sm", "test_used": "Spearman", **h5})
-
-# Save results CSV
-results_df = pd.DataFrame(results)
-results_df["significant"] = results_df["p_value"] < 0.05
-results_df.to_csv(reports_path / "hypothesis_results.csv", index=False)
-print(f"\n  Saved: hypothesis_results.csv")
-
-# Generate figures
-print(f"\n[Generating Figures]")
-plt.rcParams.update({'figure.figsize': (10, 6), 'axes.spines.top': False, 'axes.spines.right': False})
-
-# Platform usage
-fig, ax = plt.subplots()
-pcts = [(col.replace("platform_", "").title(), df[col].mean()*100) for col in PLATFORM_COLS]
-pcts.sort(key=lambda x: x[1], reverse=True)
-ax.barh([p[0] for p in pcts], [p[1] for p in pcts], color=COLORS['primary'])
-ax.set_xlabel("% of Respondents"); ax.set_title("Platform Usage")
-plt.tight_layout(); plt.savefig(figures_path / "platform_usage.png", dpi=150); plt.close()
-print(f"  platform_usage.png")
-
-# Wellbeing distributions
-fig, axes = plt.subplots(2, 2, figsize=(12, 10))
-for ax, col in zip(axes.flatten(), WELLBEING_COLS):
-    counts = df[col].value_counts().sort_index()
-    ax.bar(counts.index, counts.values, color=COLORS['secondary'])
-    ax.set_title(col.replace("_", " ").title()); ax.set_xlabel("1-5"); ax.set_ylabel("Count")
-    ax.axvline(df[col].mean(), color=COLORS['quaternary'], linestyle='--', lw=2)
-plt.tight_layout(); plt.savefig(figures_path / "wellbeing_distributions.png", dpi=150); plt.close()
-print(f"  wellbeing_distributions.png")
-
-# Time distribution
-fig, ax = plt.subplots()
-tc = df["daily_time_band"].value_counts().reindex(TIME_BAND_ORDER)
-ax.bar(range(6), tc.values, color=COLORS['tertiary'])
-ax.set_xticks(range(6)); ax.set_xticklabels(["<1h", "1-2h", "2-3h", "3-4h", "4-5h", ">5h"])
-ax.set_xlabel("Daily Time"); ax.set_ylabel("Count"); ax.set_title("Daily SM Time Distribution")
-plt.tight_layout(); plt.savefig(figures_path / "time_distribution.png", dpi=150); plt.close()
-print(f"  time_distribution.png")
-
-# Correlation heatmap
-corr_cols = BEHAVIOUR_COLS + WELLBEING_COLS
-corr = df[corr_cols].corr(method="spearman")
-fig, ax = plt.subplots(figsize=(10, 8))
-im = ax.imshow(corr.values, cmap="RdBu_r", vmin=-1, vmax=1)
-ax.set_xticks(range(len(corr_cols))); ax.set_yticks(range(len(corr_cols)))
-labels = [c.replace("_", " ")[:10] for c in corr_cols]
-ax.set_xticklabels(labels, rotation=45, ha="right"); ax.set_yticklabels(labels)
-for i in range(len(corr_cols)):
-    for j in range(len(corr_cols)):
-        ax.text(j, i, f"{corr.values[i,j]:.2f}", ha="center", va="center", fontsize=7)
-plt.colorbar(im, ax=ax); ax.set_title("Correlation Matrix")
-plt.tight_layout(); plt.savefig(figures_path / "correlation_heatmap.png", dpi=150); plt.close()
-print(f"  correlation_heatmap.png")
-
-# H1 box plot
-fig, ax = plt.subplots(figsize=(12, 6))
-box_data = [df[df["daily_time_band"] == b]["low_mood_freq"].dropna().values for b in TIME_BAND_ORDER]
-bp = ax.boxplot(box_data, tick_labels=["<1h", "1-2h", "2-3h", "3-4h", "4-5h", ">5h"], patch_artist=True)
-for p in bp["boxes"]: p.set_facecolor(COLORS['primary']); p.set_alpha(0.7)
-means = [np.mean(d) for d in box_data]
-ax.scatter(range(1,7), means, color=COLORS['quaternary'], marker='D', s=50, zorder=3)
-ax.set_xlabel("Daily Time"); ax.set_ylabel("Low Mood (1-5)"); ax.set_title("H1: Low Mood by Time Spent")
-plt.tight_layout(); plt.savefig(figures_path / "h1_low_mood_by_time_band.png", dpi=150); plt.close()
-print(f"  h1_low_mood_by_time_band.png")
-
-# H2 scatter
-fig, ax = plt.subplots()
-np.random.seed(42)
-x = df["purposeless_use"] + np.random.uniform(-0.15, 0.15, len(df))
-y = df["low_mood_freq"] + np.random.uniform(-0.15, 0.15, len(df))
-ax.scatter(x, y, alpha=0.4, color=COLORS['primary'])
-bm = df.groupby("purposeless_use")["low_mood_freq"].mean()
-ax.plot(bm.index, bm.values, color=COLORS['quaternary'], lw=3, marker='o', ms=10)
-ax.set_xlabel("Purposeless Use"); ax.set_ylabel("Low Mood"); ax.set_title(f"H2: rho={h2['statistic']:.2f}")
-plt.tight_layout(); plt.savefig(figures_path / "h2_purposeless_vs_mood.png", dpi=150); plt.close()
-print(f"  h2_purposeless_vs_mood.png")
-
-# H3 bars
-fig, ax = plt.subplots()
-cm = df.groupby("compare_to_successful")["low_mood_freq"].agg(["mean", "std", "count"])
-cm["se"] = cm["std"] / np.sqrt(cm["count"])
-ax.bar(cm.index, cm["mean"], yerr=cm["se"]*1.96, color=COLORS['secondary'], capsize=5)
-ax.set_xlabel("Compare to Successful"); ax.set_ylabel("Mean Low Mood"); ax.set_title(f"H3: rho={h3['statistic']:.2f}")
-plt.tight_layout(); plt.savefig(figures_path / "h3_comparison_vs_mood.png", dpi=150); plt.close()
-print(f"  h3_comparison_vs_mood.png")
-
-# H4 box plot
-fig, ax = plt.subplots()
-box_data = [df[df["seek_validation"] == l]["low_mood_freq"].dropna().values for l in [1,2,3,4,5]]
-bp = ax.boxplot(box_data, tick_labels=["1", "2", "3", "4", "5"], patch_artist=True)
-for p in bp["boxes"]: p.set_facecolor(COLORS['tertiary']); p.set_alpha(0.7)
-ax.set_xlabel("Validation-Seeking"); ax.set_ylabel("Low Mood"); ax.set_title(f"H4: rho={h4['statistic']:.2f}")
-plt.tight_layout(); plt.savefig(figures_path / "h4_validation_vs_mood.png", dpi=150); plt.close()
-print(f"  h4_validation_vs_mood.png")
-
-# H5 scatter
-fig, ax = plt.subplots()
-x = df["restless_without_sm"] + np.random.uniform(-0.15, 0.15, len(df))
-y = df["sleep_issues"] + np.random.uniform(-0.15, 0.15, len(df))
-ax.scatter(x, y, alpha=0.4, color=COLORS['primary'])
-bm = df.groupby("restless_without_sm")["sleep_issues"].mean()
-ax.plot(bm.index, bm.values, color=COLORS['quaternary'], lw=3, marker='o', ms=10)
-ax.set_xlabel("Restlessness"); ax.set_ylabel("Sleep Issues"); ax.set_title(f"H5: rho={h5['statistic']:.2f}")
-plt.tight_layout(); plt.savefig(figures_path / "h5_restless_vs_sleep.png", dpi=150); plt.close()
-print(f"  h5_restless_vs_sleep.png")
-
-# Segment plots
-age_counts = df["age_band"].value_counts()
-valid_ages = [b for b in ["<18", "18-24", "25-34", "35-44", "45+"] if age_counts.get(b, 0) >= 10]
-fig, ax = plt.subplots()
-box_data = [df[df["age_band"] == b]["low_mood_freq"].dropna().values for b in valid_ages]
-bp = ax.boxplot(box_data, tick_labels=valid_ages, patch_artist=True)
-for p in bp["boxes"]: p.set_facecolor(COLORS['primary']); p.set_alpha(0.7)
-ax.set_xlabel("Age Band"); ax.set_ylabel("Low Mood"); ax.set_title("Low Mood by Age")
-plt.tight_layout(); plt.savefig(figures_path / "segment_mood_by_age.png", dpi=150); plt.close()
-print(f"  segment_mood_by_age.png")
-
-gender_counts = df["gender_grouped"].value_counts()
-valid_genders = [g for g in ["Male", "Female"] if gender_counts.get(g, 0) >= 10]
-fig, ax = plt.subplots()
-box_data = [df[df["gender_grouped"] == g]["low_mood_freq"].dropna().values for g in valid_genders]
-bp = ax.boxplot(box_data, tick_labels=valid_genders, patch_artist=True)
-for p in bp["boxes"]: p.set_facecolor(COLORS['secondary']); p.set_alpha(0.7)
-ax.set_xlabel("Gender"); ax.set_ylabel("Low Mood"); ax.set_title("Low Mood by Gender")
-plt.tight_layout(); plt.savefig(figures_path / "segment_mood_by_gender.png", dpi=150); plt.close()
-print(f"  segment_mood_by_gender.png")
-
-# EDA Summary
-summary = f"""# EDA Summary Report
+# Figure functions: each takes precomputed arrays only, so it can run in a worker process
+def save_figure(path):
+    plt.tight_layout(); plt.savefig(path, dpi=150); plt.close()
+
+def plot_platform_usage(path, names, pcts):
+    fig, ax = plt.subplots()
+    ax.barh(names, pcts, color=COLORS['primary'])
+    ax.set_xlabel("% of Respondents"); ax.set_title("Platform Usage")
+    save_figure(path)
+
+def plot_wellbeing_distributions(path, distributions):
+    fig, axes = plt.subplots(2, 2, figsize=(12, 10))
+    for ax, (title, levels, counts, mean) in zip(axes.flatten(), distributions):
+        ax.bar(levels, counts, color=COLORS['secondary'])
+        ax.set_title(title); ax.set_xlabel("1-5"); ax.set_ylabel("Count")
+        ax.axvline(mean, color=COLORS['quaternary'], linestyle='--', lw=2)
+    save_figure(path)
+
+def plot_time_distribution(path, counts):
+    fig, ax = plt.subplots()
+    ax.bar(range(6), counts, color=COLORS['tertiary'])
+    ax.set_xticks(range(6)); ax.set_xticklabels(TIME_BAND_LABELS)
+    ax.set_xlabel("Daily Time"); ax.set_ylabel("Count"); ax.set_title("Daily SM Time Distribution")
+    save_figure(path)
+
+def plot_correlation_heatmap(path, corr, labels):
+    fig, ax = plt.subplots(figsize=(10, 8))
+    im = ax.imshow(corr, cmap="RdBu_r", vmin=-1, vmax=1)
+    ax.set_xticks(range(len(labels))); ax.set_yticks(range(len(labels)))
+    ax.set_xticklabels(labels, rotation=45, ha="right"); ax.set_yticklabels(labels)
+    for i in range(len(labels)):
+        for j in range(len(labels)):
+            ax.text(j, i, f"{corr[i,j]:.2f}", ha="center", va="center", fontsize=7)
+    plt.colorbar(im, ax=ax); ax.set_title("Correlation Matrix")
+    save_figure(path)
+
+def plot_boxes(path, box_data, tick_labels, color, xlabel, ylabel, title, figsize=None, show_means=False):
+    fig, ax = plt.subplots(figsize=figsize)
+    bp = ax.boxplot(box_data, tick_labels=tick_labels, patch_artist=True)
+    for p in bp["boxes"]: p.set_facecolor(color); p.set_alpha(0.7)
+    if show_means:
+        means = [np.mean(d) for d in box_data]
+        ax.scatter(range(1, len(box_data) + 1), means, color=COLORS['quaternary'], marker='D', s=50, zorder=3)
+    ax.set_xlabel(xlabel); ax.set_ylabel(ylabel); ax.set_title(title)
+    save_figure(path)
+
+def plot_jitter_scatter(path, x, y, levels, level_means, xlabel, ylabel, title):
+    fig, ax = plt.subplots()
+    ax.scatter(x, y, alpha=0.4, color=COLORS['primary'])
+    ax.plot(levels, level_means, color=COLORS['quaternary'], lw=3, marker='o', ms=10)
+    ax.set_xlabel(xlabel); ax.set_ylabel(ylabel); ax.set_title(title)
+    save_figure(path)
+
+def plot_mean_bars(path, levels, means, errors, xlabel, ylabel, title):
+    fig, ax = plt.subplots()
+    ax.bar(levels, means, yerr=errors, color=COLORS['secondary'], capsize=5)
+    ax.set_xlabel(xlabel); ax.set_ylabel(ylabel); ax.set_title(title)
+    save_figure(path)
+
+def render_figure(job):
+    plot, kwargs = job
+    plot(**kwargs)
+    return kwargs["path"].name
+
+def main():
+    print("=" * 60)
+    print("RUNNING: 02_EDA_and_Tests.ipynb")
+    print("=" * 60)
+
+    figures_path.mkdir(parents=True, exist_ok=True)
+
+    print(f"\n[Setup]")
+    print(f"  Project root: {project_root}")
+    print(f"  Data exists: {data_path.exists()}")
+
+    # Load data: analysis rows only (pre-split by the ETL), gap-free 1-5
+    # Likert scores as int8 (nullable Int8 if any score is missing),
+    # segments as categorical codes
+    df = pd.read_parquet(data_path, engine="pyarrow")
+    df = to_numpy_ints(df).astype(dict.fromkeys(SEGMENT_COLS, "category"))
+    print(f"  Loaded: {len(df)} rows for analysis")
+
+    df["daily_time_band"] = pd.Categorical(df["daily_time_band"], categories=TIME_BAND_ORDER, ordered=True)
+
+    # Data quality
+    print(f"\n[Data Quality]")
+    print(f"  Shape: {df.shape}")
+    print(f"  Duplicates: {df.duplicated().sum()}")
+    # One min/max reduction over the whole Likert block (missing scores skipped)
+    likert = df[LIKERT_COLS]
+    out_of_range = (likert.min() < 1) | (likert.max() > 5)
+    assert not out_of_range.any(), f"Likert fail: {out_of_range[out_of_range].index.tolist()}"
+    print(f"  Likert validation: PASS")
+
+    # Hypothesis testing
+    print(f"\n[Hypothesis Testing]")
+    print("-" * 60)
+    results = []
+
+    corr_cols = BEHAVIOUR_COLS + WELLBEING_COLS
+    corr = spearman_matrix(df, corr_cols)
+
+    h1 = run_kruskal(df, "daily_time_band", "low_mood_freq")
+    print(f"H1 Time->Mood: H={h1['statistic']:.2f}, p={h1['p_value']:.2e}, {h1['interpretation']}")
+    results.append({"hypothesis_id": "H1", "outcome": "low_mood_freq", "predictor": "daily_time_band", "test_used": "Kruskal-Wallis", **h1})
+
+    h2 = run_spearman(corr, df, "purposeless_use", "low_mood_freq")
+    print(f"H2 Purposeless->Mood: rho={h2['statistic']:.2f}, p={h2['p_value']:.2e}, {h2['interpretation']}")
+    results.append({"hypothesis_id": "H2", "outcome": "low_mood_freq", "predictor": "purposeless_use", "test_used": "Spearman", **h2})
+
+    h3 = run_spearman(corr, df, "compare_to_successful", "low_mood_freq")
+    print(f"H3 Compare->Mood: rho={h3['statistic']:.2f}, p={h3['p_value']:.2e}, {h3['interpretation']}")
+    results.append({"hypothesis_id": "H3", "outcome": "low_mood_freq", "predictor": "compare_to_successful", "test_used": "Spearman", **h3})
+
+    h4 = run_spearman(corr, df, "seek_validation", "low_mood_freq")
+    print(f"H4 Validation->Mood: rho={h4['statistic']:.2f}, p={h4['p_value']:.2e}, {h4['interpretation']}")
+    results.append({"hypothesis_id": "H4", "outcome": "low_mood_freq", "predictor": "seek_validation", "test_used": "Spearman", **h4})
+
+    h5 = run_spearman(corr, df, "restless_without_sm", "sleep_issues")
+    print(f"H5 Restless->Sleep: rho={h5['statistic']:.2f}, p={h5['p_value']:.2e}, {h5['interpretation']}")
+    results.append({"hypothesis_id": "H5", "outcome": "sleep_issues", "predictor": "restless_without_sm", "test_used": "Spearman", **h5})
+
+    # Save results CSV
+    results_df = pd.DataFrame(results)
+    results_df["significant"] = results_df["p_value"] < 0.05
+    results_df.to_csv(reports_path / "hypothesis_results.csv", index=False)
+    print(f"\n  Saved: hypothesis_results.csv")
+
+    # Generate figures
+    print(f"\n[Generating Figures]")
+
+    # Precompute every figure's inputs here (jitter drawn in the original order)
+    np.random.seed(42)
+    h2_x = df["purposeless_use"].to_numpy(float, na_value=np.nan) + np.random.uniform(-0.15, 0.15, len(df))
+    h2_y = df["low_mood_freq"].to_numpy(float, na_value=np.nan) + np.random.uniform(-0.15, 0.15, len(df))
+    h5_x = df["restless_without_sm"].to_numpy(float, na_value=np.nan) + np.random.uniform(-0.15, 0.15, len(df))
+    h5_y = df["sleep_issues"].to_numpy(float, na_value=np.nan) + np.random.uniform(-0.15, 0.15, len(df))
+
+    pcts = [(col.replace("platform_", "").title(), df[col].mean()*100) for col in PLATFORM_COLS]
+    pcts.sort(key=lambda x: x[1], reverse=True)
+
+    # Score counts for every wellbeing column from one bincount (6 bins per
+    # column); missing scores are left out, as value_counts would
+    wellbeing = df[WELLBEING_COLS].to_numpy(float, na_value=np.nan) + 6 * np.arange(len(WELLBEING_COLS))
+    wellbeing = wellbeing[~np.isnan(wellbeing)].astype(np.intp)
+    score_counts = np.bincount(wellbeing, minlength=6 * len(WELLBEING_COLS)).reshape(-1, 6)
+    distributions = [
+        (col.replace("_", " ").title(), np.flatnonzero(counts), counts[counts > 0], df[col].mean())
+        for col, counts in zip(WELLBEING_COLS, score_counts)
+    ]
+
+    h2_levels, _, h2_means, _ = level_stats(df, "purposeless_use", "low_mood_freq")
+    h5_levels, _, h5_means, _ = level_stats(df, "restless_without_sm", "sleep_issues")
+    h3_levels, h3_counts, h3_means, h3_std = level_stats(df, "compare_to_successful", "low_mood_freq")
+    h3_se = h3_std / np.sqrt(h3_counts)
+
+    age_counts = df["age_band"].value_counts()
+    valid_ages = [b for b in ["<18", "18-24", "25-34", "35-44", "45+"] if age_counts.get(b, 0) >= 10]
+    gender_counts = df["gender_grouped"].value_counts()
+    valid_genders = [g for g in ["Male", "Female"] if gender_counts.get(g, 0) >= 10]
+
+    jobs = [
+        (plot_platform_usage, dict(path=figures_path / "platform_usage.png",
+                                   names=[p[0] for p in pcts], pcts=[p[1] for p in pcts])),
+        (plot_wellbeing_distributions, dict(path=figures_path / "wellbeing_distributions.png",
+                                            distributions=distributions)),
+        (plot_time_distribution, dict(path=figures_path / "time_distribution.png",
+                                      counts=df["daily_time_band"].value_counts().reindex(TIME_BAND_ORDER).to_numpy())),
+        (plot_correlation_heatmap, dict(path=figures_path / "correlation_heatmap.png", corr=corr.to_numpy(),
+                                        labels=[c.replace("_", " ")[:10] for c in corr_cols])),
+        (plot_boxes, dict(path=figures_path / "h1_low_mood_by_time_band.png",
+                          box_data=box_groups(df, "daily_time_band", "low_mood_freq", TIME_BAND_ORDER),
+                          tick_labels=TIME_BAND_LABELS, color=COLORS['primary'], xlabel="Daily Time",
+                          ylabel="Low Mood (1-5)", title="H1: Low Mood by Time Spent", figsize=(12, 6), show_means=True)),
+        (plot_jitter_scatter, dict(path=figures_path / "h2_purposeless_vs_mood.png", x=h2_x, y=h2_y,
+                                   levels=h2_levels, level_means=h2_means,
+                                   xlabel="Purposeless Use", ylabel="Low Mood", title=f"H2: rho={h2['statistic']:.2f}")),
+        (plot_mean_bars, dict(path=figures_path / "h3_comparison_vs_mood.png", levels=h3_levels,
+                              means=h3_means, errors=h3_se*1.96,
+                              xlabel="Compare to Successful", ylabel="Mean Low Mood", title=f"H3: rho={h3['statistic']:.2f}")),
+        (plot_boxes, dict(path=figures_path / "h4_validation_vs_mood.png",
+                          box_data=box_groups(df, "seek_validation", "low_mood_freq", [1, 2, 3, 4, 5]),
+                          tick_labels=["1", "2", "3", "4", "5"], color=COLORS['tertiary'], xlabel="Validation-Seeking",
+                          ylabel="Low Mood", title=f"H4: rho={h4['statistic']:.2f}")),
+        (plot_jitter_scatter, dict(path=figures_path / "h5_restless_vs_sleep.png", x=h5_x, y=h5_y,
+                                   levels=h5_levels, level_means=h5_means,
+                                   xlabel="Restlessness", ylabel="Sleep Issues", title=f"H5: rho={h5['statistic']:.2f}")),
+        (plot_boxes, dict(path=figures_path / "segment_mood_by_age.png",
+                          box_data=box_groups(df, "age_band", "low_mood_freq", valid_ages),
+                          tick_labels=valid_ages, color=COLORS['primary'], xlabel="Age Band",
+                          ylabel="Low Mood", title="Low Mood by Age")),
+        (plot_boxes, dict(path=figures_path / "segment_mood_by_gender.png",
+                          box_data=box_groups(df, "gender_grouped", "low_mood_freq", valid_genders),
+                          tick_labels=valid_genders, color=COLORS['secondary'], xlabel="Gender",
+                          ylabel="Low Mood", title="Low Mood by Gender")),
+    ]
+
+    # Render and encode the PNGs in parallel, one figure per worker task
+    with ProcessPoolExecutor(max_workers=min(len(jobs), os.cpu_count() or 1)) as pool:
+        for name in pool.map(render_figure, jobs):
+            print(f"  {name}")
+    # EDA Summary
+    summary = f"""# EDA Summary Report
 
 **Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M')}
-**Dataset:** smmh_clean.csv (n={len(df)} social media users)
+**Dataset:** smmh_clean_included.parquet (n={len(df)} social media users)
 
 ## Key Findings
 
@@ -264,17 +334,21 @@ summary = f"""# EDA Summary Report
 3. Sample dominated by 18-24 age group
 """
 
-(reports_path / "eda_summary.md").write_text(summary)
-print(f"\n  Saved: eda_summary.md")
-
-# Final summary
-print("\n" + "=" * 60)
-print("NOTEBOOK EXECUTION COMPLETE")
-print("=" * 60)
-print(f"\nOutputs in: {reports_path}")
-print("\nFiles generated:")
-for f in sorted(reports_path.glob("*")):
-    if f.is_file(): print(f"  {f.name}")
-print("\nFigures:")
-for f in sorted(figures_path.glob("*.png")):
-    print(f"  {f.name}")
+    (reports_path / "eda_summary.md").write_text(summary)
+    print(f"\n  Saved: eda_summary.md")
+
+    # Final summary
+    print("\n" + "=" * 60)
+    print("NOTEBOOK EXECUTION COMPLETE")
+    print("=" * 60)
+    print(f"\nOutputs in: {reports_path}")
+    print("\nFiles generated:")
+    for f in sorted(reports_path.glob("*")):
+        if f.is_file(): print(f"  {f.name}")
+    print("\nFigures:")
+    for f in sorted(figures_path.glob("*.png")):
+        print(f"  {f.name}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,205 @@
+"""
+Aggregate Build Step for the Streamlit App
+==========================================
+
+Precomputes the small summary tables shown on the Insights and Technical
+pages so the app only loads a few rows instead of recomputing them from the
+full dataset on every rerun.
+
+Usage:
+    python src/build_aggregates.py
+
+Or import and call:
+    from src.build_aggregates import build_aggregates
+    build_aggregates()
+
+Requirements:
+    - pandas
+    - numpy
+    - scipy
+    - pyarrow
+
+Run after src/etl.py whenever the processed dataset changes.
+"""
+
+import sys
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from scipy import stats
+
+# utils/ sits in the project root, which is not on the path when this file is
+# run as a script
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from utils.frames import to_numpy_ints
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+# File paths (relative to project root)
+ANALYSIS_PARQUET_PATH = Path("data/processed/v1/smmh_clean_included.parquet")
+INSIGHT_AGGREGATES_PATH = Path("reports/insight_aggregates.parquet")
+CORR_MATRIX_PATH = Path("reports/corr_matrix.parquet")
+
+BEHAVIOUR_COLS = [
+    "purposeless_use",
+    "distracted_when_busy",
+    "restless_without_sm",
+    "compare_to_successful",
+    "seek_validation",
+]
+
+WELLBEING_COLS = [
+    "low_mood_freq",
+    "sleep_issues",
+    "worries_bother",
+    "difficulty_concentrating",
+    "interest_fluctuation",
+]
+
+TIME_BAND_ORDER = [
+    "Less than an Hour",
+    "Between 1 and 2 hours",
+    "Between 2 and 3 hours",
+    "Between 3 and 4 hours",
+    "Between 4 and 5 hours",
+    "More than 5 hours",
+]
+
+# Likert levels used for the Insights bar charts (lower edges of Medium and High)
+LEVEL_EDGES = [3, 4]
+LEVEL_LABELS = ["Low (1-2)", "Medium (3)", "High (4-5)"]
+
+
+# =============================================================================
+# BUILD FUNCTIONS
+# =============================================================================
+
+
+def load_analysis_data(filepath: Path) -> pd.DataFrame:
+    """Load the analysis subset written by the ETL (social media users only)."""
+    print(f"Loading analysis data from: {filepath}")
+
+    if not filepath.exists():
+        raise FileNotFoundError(f"Analysis data file not found: {filepath}")
+
+    df = pd.read_parquet(
+        filepath,
+        engine="pyarrow",
+        columns=BEHAVIOUR_COLS + WELLBEING_COLS + ["daily_time_band"],
+    )
+    print(f"  Loaded {len(df)} rows for analysis")
+
+    df = to_numpy_ints(df)
+    df["daily_time_band"] = pd.Categorical(df["daily_time_band"], categories=TIME_BAND_ORDER, ordered=True)
+
+    return df
+
+
+def level_mood(df: pd.DataFrame, predictor: str) -> pd.DataFrame:
+    """Average low mood score per binned level of a Likert predictor."""
+    levels = np.digitize(df[predictor].to_numpy(), LEVEL_EDGES)
+    counts = np.bincount(levels, minlength=len(LEVEL_LABELS))
+    sums = np.bincount(levels, weights=df["low_mood_freq"].to_numpy(float), minlength=len(LEVEL_LABELS))
+    observed = counts > 0
+
+    return pd.DataFrame({
+        "level": np.array(LEVEL_LABELS)[observed],
+        "avg_low_mood": sums[observed] / counts[observed],
+        "count": counts[observed],
+    })
+
+
+def time_mood(df: pd.DataFrame) -> pd.DataFrame:
+    """Average low mood score and respondent count per daily time band."""
+    mood = df.groupby("daily_time_band", observed=True)["low_mood_freq"].agg(["mean", "count"])
+
+    return pd.DataFrame({
+        "level": mood.index.astype(str),
+        "avg_low_mood": mood["mean"].values,
+        "count": mood["count"].values,
+    })
+
+
+def build_insight_aggregates(df: pd.DataFrame) -> pd.DataFrame:
+    """Stack the Insights page aggregates into one long table keyed by chart."""
+    print("Building Insights aggregates...")
+
+    aggregates = pd.concat(
+        [
+            level_mood(df, "compare_to_successful").assign(chart="comparison_mood"),
+            level_mood(df, "purposeless_use").assign(chart="purposeless_mood"),
+            time_mood(df).assign(chart="time_mood"),
+        ],
+        ignore_index=True,
+    )
+    aggregates = aggregates[["chart", "level", "avg_low_mood", "count"]]
+
+    print(f"  Built {len(aggregates)} rows across {aggregates['chart'].nunique()} charts")
+
+    return aggregates
+
+
+def build_corr_matrix(df: pd.DataFrame) -> pd.DataFrame:
+    """Spearman correlations between behaviour and wellbeing columns."""
+    print("Building behaviour vs wellbeing correlation matrix...")
+
+    # Pearson on average ranks == Spearman: rank every column in one call,
+    # then a single corrcoef matmul over the rank matrix
+    ranks = stats.rankdata(df[BEHAVIOUR_COLS + WELLBEING_COLS].to_numpy(float), axis=0)
+    corr = np.corrcoef(ranks, rowvar=False)
+
+    n_behaviour = len(BEHAVIOUR_COLS)
+    corr_matrix = pd.DataFrame(
+        corr[:n_behaviour, n_behaviour:],
+        index=BEHAVIOUR_COLS,
+        columns=WELLBEING_COLS,
+    )
+
+    print(f"  Built {corr_matrix.shape[0]}x{corr_matrix.shape[1]} matrix")
+
+    return corr_matrix
+
+
+def save_table(df: pd.DataFrame, filepath: Path, index: bool = False) -> None:
+    """Save a summary table as Parquet."""
+    print(f"Saving: {filepath}")
+
+    filepath.parent.mkdir(parents=True, exist_ok=True)
+    df.to_parquet(filepath, engine="pyarrow", index=index)
+
+
+# =============================================================================
+# MAIN BUILD
+# =============================================================================
+
+
+def build_aggregates(
+    data_path: Path = ANALYSIS_PARQUET_PATH,
+    aggregates_path: Path = INSIGHT_AGGREGATES_PATH,
+    corr_path: Path = CORR_MATRIX_PATH,
+) -> None:
+    """Build every precomputed table used by the Streamlit pages."""
+    print("=" * 60)
+    print("BUILD AGGREGATES: Streamlit summary tables")
+    print("=" * 60)
+
+    df = load_analysis_data(data_path)
+    save_table(build_insight_aggregates(df), aggregates_path)
+    save_table(build_corr_matrix(df), corr_path, index=True)
+
+    print("\n" + "=" * 60)
+    print("BUILD COMPLETE")
+    print("=" * 60)
+    print(f"  Insight aggregates: {aggregates_path}")
+    print(f"  Correlation matrix: {corr_path}")
+
+
+if __name__ == "__main__":
+    # Change to project root if running from src/
+    import os
+    if os.path.basename(os.getcwd()) == "src":
+        os.chdir("..")
+
+    build_aggregates()
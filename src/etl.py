@@ -15,12 +15,23 @@ Or import and call:
 Requirements:
     - pandas
     - numpy
+    - pyarrow (Parquet output)
 
 Author: ETL Pipeline for Capstone Project
 """
 
+import csv
+import multiprocessing
+import re
+import numpy as np
 import pandas as pd
 from pathlib import Path
+from typing import Iterator, TextIO
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from queue import Full, Queue
+from threading import Event, Thread
 from datetime import datetime
 
 # =============================================================================
@@ -30,9 +41,14 @@ from datetime import datetime
 # File paths (relative to project root)
 RAW_DATA_PATH = Path("data/raw/v1/smmh.csv")
 PROCESSED_DATA_PATH = Path("data/processed/v1/smmh_clean.csv")
+PROCESSED_PARQUET_PATH = Path("data/processed/v1/smmh_clean.parquet")
+ANALYSIS_PARQUET_PATH = Path("data/processed/v1/smmh_clean_included.parquet")
 DATA_DICTIONARY_PATH = Path("docs/data_dictionary.md")
 ETL_REPORT_PATH = Path("reports/etl_report.md")
 
+# Raw CSV rows parsed and cleaned per chunk (bounds memory to one raw chunk)
+CHUNK_SIZE = 5000
+
 # Column mapping: original survey questions -> clean snake_case names
 COLUMN_MAPPING = {
     "Timestamp": "timestamp",  # Will be dropped for privacy
@@ -97,6 +113,17 @@ AFFILIATIONS = {
     "na": ["N/A", "NA", ""],
 }
 
+# One compiled alternation of the escaped, lowercased values per affiliation,
+# matched against lowercased answers. The empty "na" value matches every answer
+AFFILIATION_PATTERNS = {
+    key: re.compile("|".join(re.escape(v.lower()) for v in values))
+    for key, values in AFFILIATIONS.items()
+}
+
+# Age bands: lower edge of every band after "<18"; ages are binned [lower, next lower)
+AGE_BAND_EDGES = [18, 25, 35, 45]
+AGE_BAND_LABELS = ["<18", "18-24", "25-34", "35-44", "45+"]
+
 # Time band to midpoint mapping
 TIME_BAND_MIDPOINTS = {
     "Less than an Hour": 0.5,
@@ -107,6 +134,29 @@ TIME_BAND_MIDPOINTS = {
     "More than 5 hours": 5.5,
 }
 
+# Low-cardinality text columns stored as categories: ordered columns list their
+# natural order, None lets pandas infer unordered categories
+CATEGORY_ORDERS = {
+    "age_band": AGE_BAND_LABELS + ["Unknown"],
+    "gender_clean": None,
+    "gender_grouped": None,
+    "relationship_status": None,
+    "occupation_status": None,
+    "daily_time_band": list(TIME_BAND_MIDPOINTS),
+}
+
+# Yes/No answers (stripped, lowercased) -> boolean; anything else is missing
+BOOL_MAP = {
+    "yes": True,
+    "y": True,
+    "true": True,
+    "1": True,
+    "no": False,
+    "n": False,
+    "false": False,
+    "0": False,
+}
+
 # Gender normalisation mapping
 GENDER_NORMALISATION = {
     # Male variants
@@ -160,17 +210,106 @@ GENDER_GROUPING = {
 # =============================================================================
 
 
-def load_raw_data(filepath: Path) -> pd.DataFrame:
-    """Load raw CSV data and perform initial validation."""
+def load_raw_chunks(
+    filepath: Path,
+    chunksize: int = CHUNK_SIZE,
+    fast_io: bool = False,
+) -> Iterator[pd.DataFrame]:
+    """
+    Stream the raw CSV in chunks so only one chunk of raw text is in memory.
+
+    Cells are read as strings, so every chunk has the same dtypes whatever
+    values it happens to hold; the cleaning steps convert the numeric columns.
+
+    With fast_io=True the file is parsed by pyarrow's streaming CSV reader,
+    one block of roughly `chunksize` rows at a time, each converted to pandas
+    as it arrives.
+    """
     print(f"Loading raw data from: {filepath}")
 
     if not filepath.exists():
         raise FileNotFoundError(f"Raw data file not found: {filepath}")
 
-    df = pd.read_csv(filepath)
-    print(f"  Loaded {len(df)} rows, {len(df.columns)} columns")
-
-    return df
+    if fast_io:
+        import pyarrow as pa
+        import pyarrow.csv as pacsv
+
+        # pyarrow blocks are sized in bytes: aim for about `chunksize` rows
+        # from the mean row length at the start of the file
+        with open(filepath, "rb") as f:
+            sample = f.read(1 << 16)
+        block_size = max(int(len(sample) / max(sample.count(b"\n"), 1) * chunksize), 1 << 14)
+
+        # Types are otherwise inferred from the first block only, so read
+        # strings throughout; empty and N/A-style cells become missing, as
+        # with pandas' reader
+        with open(filepath, newline="", encoding="utf-8") as f:
+            header = next(csv.reader(f))
+        def batches():
+            # Opened here so closing the generator also releases the file
+            with pacsv.open_csv(
+                filepath,
+                read_options=pacsv.ReadOptions(block_size=block_size),
+                convert_options=pacsv.ConvertOptions(
+                    column_types={col: pa.string() for col in header},
+                    strings_can_be_null=True,
+                ),
+            ) as reader:
+                for batch in reader:
+                    yield batch.to_pandas()
+
+        return batches()
+
+    return pd.read_csv(filepath, chunksize=chunksize, dtype=str)
+
+
+def prefetch_chunks(chunks: Iterator[pd.DataFrame], depth: int = 2) -> Iterator[pd.DataFrame]:
+    """
+    Parse upcoming raw chunks on a background thread while the caller cleans
+    the current one. At most `depth` parsed chunks wait in the queue; chunks
+    already handed to the caller (e.g. submitted to a worker pool) are not
+    counted. A parse error is re-raised in the caller, and if the caller
+    stops early the thread exits and the source reader is closed.
+    """
+    queue = Queue(maxsize=depth)
+    stop = Event()
+    done = object()
+
+    def put(item):
+        # Time out now and then so a stopped consumer can't block the thread
+        while not stop.is_set():
+            try:
+                queue.put(item, timeout=0.1)
+                return True
+            except Full:
+                pass
+        return False
+
+    def load():
+        try:
+            for chunk in chunks:
+                if not put(chunk):
+                    return
+            put(done)
+        except Exception as exc:
+            put(exc)
+
+    loader = Thread(target=load, daemon=True)
+    loader.start()
+
+    try:
+        while True:
+            item = queue.get()
+            if item is done:
+                return
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        stop.set()
+        loader.join()
+        if hasattr(chunks, "close"):
+            chunks.close()
 
 
 def rename_columns(df: pd.DataFrame) -> pd.DataFrame:
@@ -206,29 +345,17 @@ def clean_age(df: pd.DataFrame) -> pd.DataFrame:
     # Convert to numeric, coercing errors to NaN
     df["age"] = pd.to_numeric(df["age"], errors="coerce")
 
-    # Create age bands
-    def get_age_band(age):
-        if pd.isna(age):
-            return "Unknown"
-        age = int(age)
-        if age < 18:
-            return "<18"
-        elif age <= 24:
-            return "18-24"
-        elif age <= 34:
-            return "25-34"
-        elif age <= 44:
-            return "35-44"
-        else:
-            return "45+"
-
-    df["age_band"] = df["age"].apply(get_age_band)
+    # Create age bands: band codes from one binary search over the band edges
+    # (age == edge opens the next band); missing ages -> "Unknown"
+    age = df["age"].to_numpy(dtype="float64")
+    codes = np.searchsorted(AGE_BAND_EDGES, age, side="right")
+    codes[np.isnan(age)] = len(AGE_BAND_LABELS)
+    df["age_band"] = pd.Categorical.from_codes(codes, categories=CATEGORY_ORDERS["age_band"], ordered=True)
 
     # Convert age to nullable integer (round first to handle float conversion)
     df["age"] = pd.array(df["age"].round().values, dtype="Int64")
 
     print(f"  Age range: {df['age'].min()} - {df['age'].max()}")
-    print(f"  Age bands: {df['age_band'].value_counts().to_dict()}")
 
     return df
 
@@ -237,21 +364,15 @@ def clean_gender(df: pd.DataFrame) -> pd.DataFrame:
     """Standardise gender values and create grouped column."""
     print("Processing gender...")
 
-    def normalise_gender(val):
-        if pd.isna(val):
-            return "Prefer not to say"
-
-        # Strip whitespace and lowercase for matching
-        val_clean = str(val).strip().lower()
-
-        # Look up in normalisation mapping
-        if val_clean in GENDER_NORMALISATION:
-            return GENDER_NORMALISATION[val_clean]
-
-        # If not found, return "Other"
-        return "Other"
-
-    df["gender_clean"] = df["gender_raw"].apply(normalise_gender)
+    # Strip whitespace and lowercase for matching; unmapped values become "Other"
+    gender = df["gender_raw"].astype("string")
+    df["gender_clean"] = (
+        gender.str.strip().str.lower()
+        .map(GENDER_NORMALISATION)
+        .fillna("Other")
+        .mask(gender.isna(), "Prefer not to say")
+        .astype(object)
+    )
 
     # Create grouped column
     df["gender_grouped"] = df["gender_clean"].map(GENDER_GROUPING)
@@ -259,9 +380,6 @@ def clean_gender(df: pd.DataFrame) -> pd.DataFrame:
     # Drop the raw column
     df = df.drop(columns=["gender_raw"])
 
-    print(f"  Gender clean distribution: {df['gender_clean'].value_counts().to_dict()}")
-    print(f"  Gender grouped distribution: {df['gender_grouped'].value_counts().to_dict()}")
-
     return df
 
 
@@ -269,19 +387,12 @@ def clean_yes_no(df: pd.DataFrame) -> pd.DataFrame:
     """Convert Yes/No columns to boolean."""
     print("Converting Yes/No to boolean...")
 
-    def to_bool(val):
-        if pd.isna(val):
-            return None
-        val_str = str(val).strip().lower()
-        if val_str in ["yes", "y", "true", "1"]:
-            return True
-        elif val_str in ["no", "n", "false", "0"]:
-            return False
-        return None
-
-    df["uses_social_media"] = df["uses_social_media"].apply(to_bool)
-
-    print(f"  uses_social_media: {df['uses_social_media'].value_counts().to_dict()}")
+    df["uses_social_media"] = (
+        df["uses_social_media"].astype("string")
+        .str.strip().str.lower()
+        .map(BOOL_MAP)
+        .astype("boolean")
+    )
 
     return df
 
@@ -290,52 +401,41 @@ def parse_platforms(df: pd.DataFrame) -> pd.DataFrame:
     """Parse multi-select platforms into individual flag columns."""
     print("Parsing platform flags...")
 
-    for platform in PLATFORMS:
-        col_name = f"platform_{platform.lower()}"
-
-        def has_platform(val, p=platform):
-            if pd.isna(val):
-                return 0
-            return 1 if p.lower() in str(val).lower() else 0
-
-        df[col_name] = df["platforms_raw"].apply(has_platform)
+    # Lowercase once, then one vectorised substring scan per platform
+    platforms = df["platforms_raw"].astype("string").str.lower()
+    flags = pd.DataFrame(
+        {
+            f"platform_{platform.lower()}": platforms.str.contains(platform.lower(), regex=False, na=False).astype("uint8")
+            for platform in PLATFORMS
+        },
+        index=df.index,
+    )
 
     # Count platforms per row
-    platform_cols = [f"platform_{p.lower()}" for p in PLATFORMS]
-    df["platform_count"] = df[platform_cols].sum(axis=1)
+    platform_count = flags.sum(axis=1).astype("uint16").rename("platform_count")
 
-    print(f"  Platform usage counts:")
-    for p in PLATFORMS:
-        col = f"platform_{p.lower()}"
-        print(f"    {p}: {df[col].sum()}")
-
-    return df
+    # Attach every new column in one concat rather than one insert each
+    return pd.concat([df, flags, platform_count], axis=1, copy=False)
 
 
 def parse_affiliations(df: pd.DataFrame) -> pd.DataFrame:
     """Parse organisation affiliations into flag columns."""
     print("Parsing affiliation flags...")
 
-    for affil_key, affil_values in AFFILIATIONS.items():
-        col_name = f"affil_{affil_key}"
-
-        def has_affiliation(val, values=affil_values):
-            if pd.isna(val):
-                return 1 if "" in values else 0
-            val_str = str(val).strip()
-            for v in values:
-                if v.lower() in val_str.lower():
-                    return 1
-            return 0
-
-        df[col_name] = df["org_affiliations_raw"].apply(has_affiliation)
-
-    print(f"  Affiliation counts:")
-    for affil_key in AFFILIATIONS.keys():
-        col = f"affil_{affil_key}"
-        print(f"    {affil_key}: {df[col].sum()}")
+    # Lowercase once, then one precompiled pattern per key. Missing answers
+    # only count towards the key that lists an empty value
+    affiliations = df["org_affiliations_raw"].astype("string").str.lower()
+    flags = pd.DataFrame(
+        {
+            f"affil_{affil_key}": affiliations.str.contains(
+                AFFILIATION_PATTERNS[affil_key], regex=True, na="" in affil_values
+            ).astype("uint8")
+            for affil_key, affil_values in AFFILIATIONS.items()
+        },
+        index=df.index,
+    )
 
-    return df
+    return pd.concat([df, flags], axis=1, copy=False)
 
 
 def create_time_midpoint(df: pd.DataFrame) -> pd.DataFrame:
@@ -349,8 +449,6 @@ def create_time_midpoint(df: pd.DataFrame) -> pd.DataFrame:
     if len(unmapped) > 0:
         print(f"  WARNING: Unmapped time bands: {unmapped}")
 
-    print(f"  Time band distribution: {df['daily_time_band'].value_counts().to_dict()}")
-
     return df
 
 
@@ -358,26 +456,28 @@ def validate_likert_scales(df: pd.DataFrame) -> pd.DataFrame:
     """Validate and convert Likert scale columns to integers 1-5."""
     print("Validating Likert scale columns...")
 
-    for col in LIKERT_COLUMNS:
-        if col not in df.columns:
-            raise ValueError(f"Missing Likert column: {col}")
-
-        # Convert to numeric
-        df[col] = pd.to_numeric(df[col], errors="coerce")
+    missing_cols = [col for col in LIKERT_COLUMNS if col not in df.columns]
+    if missing_cols:
+        raise ValueError(f"Missing Likert column: {missing_cols[0]}")
 
-        # Check range
-        min_val = df[col].min()
-        max_val = df[col].max()
+    # Convert, range-check and cast the whole Likert block at once
+    likert = df[LIKERT_COLUMNS].apply(pd.to_numeric, errors="coerce")
+    min_vals = likert.min()
+    max_vals = likert.max()
 
-        if pd.notna(min_val) and min_val < 1:
-            raise ValueError(f"Likert column '{col}' has value below 1: {min_val}")
-        if pd.notna(max_val) and max_val > 5:
-            raise ValueError(f"Likert column '{col}' has value above 5: {max_val}")
+    below = min_vals[min_vals < 1]
+    if len(below) > 0:
+        raise ValueError(f"Likert column '{below.index[0]}' has value below 1: {below.iloc[0]}")
+    above = max_vals[max_vals > 5]
+    if len(above) > 0:
+        raise ValueError(f"Likert column '{above.index[0]}' has value above 5: {above.iloc[0]}")
 
-        # Convert to integer
-        df[col] = df[col].astype("Int64")
+    # 1-5 scores fit in a nullable 1-byte integer
+    df[LIKERT_COLUMNS] = likert.astype("Int8")
 
-        print(f"  {col}: range [{min_val}-{max_val}], missing: {df[col].isna().sum()}")
+    missing = likert.isna().sum()
+    for col in LIKERT_COLUMNS:
+        print(f"  {col}: range [{min_vals[col]}-{max_vals[col]}], missing: {missing[col]}")
 
     return df
 
@@ -386,7 +486,7 @@ def create_analysis_flag(df: pd.DataFrame) -> pd.DataFrame:
     """Create include_in_analysis flag based on social media usage."""
     print("Creating include_in_analysis flag...")
 
-    df["include_in_analysis"] = df["uses_social_media"] == True
+    df["include_in_analysis"] = df["uses_social_media"].fillna(False).astype(bool)
 
     included = df["include_in_analysis"].sum()
     excluded = len(df) - included
@@ -397,28 +497,83 @@ def create_analysis_flag(df: pd.DataFrame) -> pd.DataFrame:
     return df
 
 
-def run_quality_checks(df: pd.DataFrame, stage: str = "final") -> dict:
-    """Run data quality checks and return summary."""
+def categorise_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """Store low-cardinality text columns as categories (integer codes)."""
+    print("Converting text columns to categories...")
+
+    for col, order in CATEGORY_ORDERS.items():
+        if order is None:
+            df[col] = df[col].astype("category")
+        else:
+            # Unexpected values are kept after the known order rather than becoming NaN
+            extra = sorted(set(df[col].dropna()) - set(order))
+            df[col] = pd.Categorical(df[col], categories=order + extra, ordered=True)
+
+        print(f"  {col}: {len(df[col].cat.categories)} categories")
+
+    return df
+
+
+def run_quality_checks(df: pd.DataFrame, stage: str = "final", verbose: bool = False) -> dict:
+    """Run data quality checks and return summary; verbose also prints value distributions."""
     print(f"\nRunning quality checks ({stage})...")
 
+    # Missingness by column, counted for the whole frame in one call
+    missing = df.isna().sum()
+
+    row_count = len(df)
+    columns = list(df.columns)
     checks = {
         "stage": stage,
-        "row_count": len(df),
-        "column_count": len(df.columns),
+        "row_count": row_count,
+        "column_count": len(columns),
         "duplicate_rows": df.duplicated().sum(),
-        "missingness": {},
-        "columns": list(df.columns),
+        "missingness": {
+            col: {
+                "count": int(count),
+                "pct": round(count / row_count * 100, 2),
+            }
+            for col, count in missing[missing > 0].items()
+        },
+        "columns": columns,
     }
 
-    # Missingness by column
-    for col in df.columns:
-        missing = df[col].isna().sum()
-        if missing > 0:
-            checks["missingness"][col] = {
-                "count": int(missing),
-                "pct": round(missing / len(df) * 100, 2),
+    print_quality_checks(checks)
+    if verbose:
+        print_distributions(df)
+
+    return checks
+
+
+def run_raw_quality_checks(row_hashes: pd.Series, missing: pd.Series) -> dict:
+    """Run the raw-stage quality checks from per-row hashes and per-column missing counts."""
+    print("\nRunning quality checks (raw)...")
+
+    row_count = len(row_hashes)
+    checks = {
+        "stage": "raw",
+        "row_count": row_count,
+        "column_count": len(missing),
+        # Rows are hashed with the same dtypes in every chunk, so identical
+        # rows hash identically and duplicates are found across chunks
+        "duplicate_rows": row_hashes.duplicated().sum(),
+        "missingness": {
+            col: {
+                "count": int(count),
+                "pct": round(count / row_count * 100, 2),
             }
+            for col, count in missing[missing > 0].items()
+        },
+        "columns": list(missing.index),
+    }
+
+    print_quality_checks(checks)
+
+    return checks
+
 
+def print_quality_checks(checks: dict) -> None:
+    """Print the quality check summary."""
     print(f"  Row count: {checks['row_count']}")
     print(f"  Column count: {checks['column_count']}")
     print(f"  Duplicate rows: {checks['duplicate_rows']}")
@@ -427,7 +582,15 @@ def run_quality_checks(df: pd.DataFrame, stage: str = "final") -> dict:
     if checks["duplicate_rows"] > 0:
         print(f"  WARNING: {checks['duplicate_rows']} duplicate rows found!")
 
-    return checks
+
+def print_distributions(df: pd.DataFrame) -> None:
+    """Print category/boolean value counts and platform/affiliation flag totals."""
+    print("  Distributions:")
+    for col in df.select_dtypes(["category", "boolean", "bool"]).columns:
+        print(f"    {col}: {df[col].value_counts().to_dict()}")
+
+    flag_cols = [f"platform_{p.lower()}" for p in PLATFORMS] + [f"affil_{k}" for k in AFFILIATIONS]
+    print(f"    Flag totals: {df[flag_cols].sum().to_dict()}")
 
 
 def reorder_columns(df: pd.DataFrame) -> pd.DataFrame:
@@ -456,16 +619,18 @@ def reorder_columns(df: pd.DataFrame) -> pd.DataFrame:
         behaviour_cols + wellbeing_cols + raw_cols + flag_cols
     )
 
-    # Only include columns that exist
-    final_cols = [c for c in ordered_cols if c in df.columns]
+    # Only include columns that exist (set lookups, not list scans)
+    existing = set(df.columns)
+    final_cols = [c for c in ordered_cols if c in existing]
 
     # Add any columns we might have missed
-    remaining = [c for c in df.columns if c not in final_cols]
+    ordered = set(final_cols)
+    remaining = [c for c in df.columns if c not in ordered]
     if remaining:
         print(f"  Adding remaining columns: {remaining}")
         final_cols.extend(remaining)
 
-    df = df[final_cols]
+    df = df.reindex(columns=final_cols, copy=False)
 
     return df
 
@@ -480,6 +645,27 @@ def save_processed_data(df: pd.DataFrame, filepath: Path) -> None:
     print(f"  Saved {len(df)} rows, {len(df.columns)} columns")
 
 
+def save_processed_parquet(df: pd.DataFrame, filepath: Path) -> None:
+    """Save the cleaned dataset as Parquet for the Streamlit app."""
+    print(f"Saving Parquet copy to: {filepath}")
+
+    filepath.parent.mkdir(parents=True, exist_ok=True)
+    df.to_parquet(filepath, engine="pyarrow", compression="snappy", index=False)
+
+    print(f"  Saved {len(df)} rows, {len(df.columns)} columns")
+
+
+def save_analysis_parquet(df: pd.DataFrame, filepath: Path) -> None:
+    """Save the analysis rows (include_in_analysis=True) as Parquet, without the flag."""
+    print(f"Saving analysis subset to: {filepath}")
+
+    filepath.parent.mkdir(parents=True, exist_ok=True)
+    analysis = df[df["include_in_analysis"]].drop(columns="include_in_analysis")
+    analysis.to_parquet(filepath, engine="pyarrow", compression="snappy", index=False)
+
+    print(f"  Saved {len(analysis)} rows, {len(analysis.columns)} columns")
+
+
 def generate_data_dictionary(df: pd.DataFrame, filepath: Path) -> None:
     """Generate markdown data dictionary."""
     print(f"\nGenerating data dictionary: {filepath}")
@@ -581,180 +767,253 @@ def generate_data_dictionary(df: pd.DataFrame, filepath: Path) -> None:
     print(f"  Generated data dictionary with {len(df.columns)} columns")
 
 
+def write_count_rows(f: TextIO, counts: pd.Series, total: int) -> None:
+    """Write `| label | count | pct% |` table rows; percentages in one vectorised pass."""
+    pcts = (counts / total * 100).round(1)
+    for label, count, pct in zip(counts.index, counts.to_numpy(), pcts.to_numpy()):
+        f.write(f"| {label} | {count} | {pct}% |\n")
+
+
 def generate_etl_report(
-    _df_before: pd.DataFrame,  # Retained for potential future use
     df_after: pd.DataFrame,
     checks_before: dict,
     checks_after: dict,
     filepath: Path,
 ) -> None:
-    """Generate ETL summary report."""
+    """Generate ETL summary report, streamed straight to the output file."""
     print(f"\nGenerating ETL report: {filepath}")
 
-    lines = [
-        "# ETL Report",
-        "",
-        f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M')}",
-        "",
-        "## Dataset Shape",
-        "",
-        "| Metric | Before | After |",
-        "|--------|--------|-------|",
-        f"| Rows | {checks_before['row_count']} | {checks_after['row_count']} |",
-        f"| Columns | {checks_before['column_count']} | {checks_after['column_count']} |",
-        f"| Duplicate rows | {checks_before['duplicate_rows']} | {checks_after['duplicate_rows']} |",
-        "",
-        "## Columns Added/Removed",
-        "",
-        f"- **Dropped:** `timestamp` (privacy/re-identification risk)",
-        f"- **Added:** `age_band`, `gender_clean`, `gender_grouped`, `daily_hours_midpoint`, platform flags, affiliation flags, `include_in_analysis`",
-        "",
-        "## Missingness Summary",
-        "",
-    ]
-
-    if checks_after["missingness"]:
-        lines.append("| Column | Missing Count | % |")
-        lines.append("|--------|---------------|---|")
-        for col, info in checks_after["missingness"].items():
-            lines.append(f"| `{col}` | {info['count']} | {info['pct']}% |")
-    else:
-        lines.append("No missing values in final dataset.")
-
-    lines.extend([
-        "",
-        "## Gender Distribution",
-        "",
-        "### Cleaned",
-        "",
-        "| Gender | Count | % |",
-        "|--------|-------|---|",
-    ])
+    total = len(df_after)
 
+    # Every count shown in the report, each from one vectorised reduction
     gender_clean = df_after["gender_clean"].value_counts()
-    for g, count in gender_clean.items():
-        pct = round(count / len(df_after) * 100, 1)
-        lines.append(f"| {g} | {count} | {pct}% |")
-
-    lines.extend([
-        "",
-        "### Grouped",
-        "",
-        "| Gender Group | Count | % |",
-        "|--------------|-------|---|",
-    ])
-
     gender_grouped = df_after["gender_grouped"].value_counts()
-    for g, count in gender_grouped.items():
-        pct = round(count / len(df_after) * 100, 1)
-        lines.append(f"| {g} | {count} | {pct}% |")
+    platform_users = df_after[[f"platform_{p.lower()}" for p in PLATFORMS]].sum().set_axis(PLATFORMS)
+    uses_sm = df_after["uses_social_media"].sum()
+    uses_sm_pct = round(uses_sm / total * 100, 1)
+    included = df_after["include_in_analysis"].sum()
+    excluded = total - included
 
-    lines.extend([
-        "",
-        "## Platform Usage",
-        "",
-        "| Platform | Users | % |",
-        "|----------|-------|---|",
-    ])
+    filepath.parent.mkdir(parents=True, exist_ok=True)
+    with filepath.open("w") as f:
+        f.write(
+            "# ETL Report\n"
+            "\n"
+            f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M')}\n"
+            "\n"
+            "## Dataset Shape\n"
+            "\n"
+            "| Metric | Before | After |\n"
+            "|--------|--------|-------|\n"
+            f"| Rows | {checks_before['row_count']} | {checks_after['row_count']} |\n"
+            f"| Columns | {checks_before['column_count']} | {checks_after['column_count']} |\n"
+            f"| Duplicate rows | {checks_before['duplicate_rows']} | {checks_after['duplicate_rows']} |\n"
+            "\n"
+            "## Columns Added/Removed\n"
+            "\n"
+            "- **Dropped:** `timestamp` (privacy/re-identification risk)\n"
+            "- **Added:** `age_band`, `gender_clean`, `gender_grouped`, `daily_hours_midpoint`, platform flags, affiliation flags, `include_in_analysis`\n"
+            "\n"
+            "## Missingness Summary\n"
+            "\n"
+        )
+
+        if checks_after["missingness"]:
+            f.write("| Column | Missing Count | % |\n")
+            f.write("|--------|---------------|---|\n")
+            for col, info in checks_after["missingness"].items():
+                f.write(f"| `{col}` | {info['count']} | {info['pct']}% |\n")
+        else:
+            f.write("No missing values in final dataset.\n")
+
+        f.write(
+            "\n"
+            "## Gender Distribution\n"
+            "\n"
+            "### Cleaned\n"
+            "\n"
+            "| Gender | Count | % |\n"
+            "|--------|-------|---|\n"
+        )
+        write_count_rows(f, gender_clean, total)
+
+        f.write(
+            "\n"
+            "### Grouped\n"
+            "\n"
+            "| Gender Group | Count | % |\n"
+            "|--------------|-------|---|\n"
+        )
+        write_count_rows(f, gender_grouped, total)
+
+        f.write(
+            "\n"
+            "## Platform Usage\n"
+            "\n"
+            "| Platform | Users | % |\n"
+            "|----------|-------|---|\n"
+        )
+        write_count_rows(f, platform_users, total)
+
+        f.write(
+            "\n"
+            "## Social Media Usage\n"
+            "\n"
+            f"- **Uses social media:** {uses_sm} ({uses_sm_pct}%)\n"
+            f"- **Does not use SM:** {total - uses_sm} ({round(100 - uses_sm_pct, 1)}%)\n"
+            "\n"
+            "## Analysis Inclusion\n"
+            "\n"
+            f"- **Included (`include_in_analysis=True`):** {included} rows\n"
+            f"- **Excluded (`include_in_analysis=False`):** {excluded} rows\n"
+            "\n"
+            "Excluded rows are respondents who answered 'No' to using social media. They are retained in the dataset but should be filtered out for SM-behaviour analysis.\n"
+            "\n"
+            "## Data Quality\n"
+            "\n"
+            "- All Likert columns validated: values in range 1-5\n"
+            "- No duplicate rows\n"
+            "- Timestamp dropped for privacy\n"
+        )
 
-    for p in PLATFORMS:
-        col = f"platform_{p.lower()}"
-        count = df_after[col].sum()
-        pct = round(count / len(df_after) * 100, 1)
-        lines.append(f"| {p} | {count} | {pct}% |")
+    print(f"  Generated ETL report")
 
-    lines.extend([
-        "",
-        "## Social Media Usage",
-        "",
-    ])
 
-    uses_sm = df_after["uses_social_media"].sum()
-    uses_sm_pct = round(uses_sm / len(df_after) * 100, 1)
-    lines.append(f"- **Uses social media:** {uses_sm} ({uses_sm_pct}%)")
-    lines.append(f"- **Does not use SM:** {len(df_after) - uses_sm} ({round(100 - uses_sm_pct, 1)}%)")
+# =============================================================================
+# MAIN ETL PIPELINE
+# =============================================================================
 
-    lines.extend([
-        "",
-        "## Analysis Inclusion",
-        "",
-    ])
 
-    included = df_after["include_in_analysis"].sum()
-    excluded = len(df_after) - included
+def transform_chunk(df: pd.DataFrame) -> pd.DataFrame:
+    """Apply every cleaning step to one chunk of raw rows."""
+    df = rename_columns(df)
+    df = drop_timestamp(df)
+    df = clean_age(df)
+    df = clean_gender(df)
+    df = clean_yes_no(df)
+    df = parse_platforms(df)
+    df = parse_affiliations(df)
+    df = create_time_midpoint(df)
+    df = validate_likert_scales(df)
+    df = create_analysis_flag(df)
+    df = reorder_columns(df)
 
-    lines.append(f"- **Included (`include_in_analysis=True`):** {included} rows")
-    lines.append(f"- **Excluded (`include_in_analysis=False`):** {excluded} rows")
-    lines.append("")
-    lines.append("Excluded rows are respondents who answered 'No' to using social media. They are retained in the dataset but should be filtered out for SM-behaviour analysis.")
+    return df
 
-    lines.extend([
-        "",
-        "## Data Quality",
-        "",
-        f"- All Likert columns validated: values in range 1-5",
-        f"- No duplicate rows",
-        f"- Timestamp dropped for privacy",
-        "",
-    ])
 
-    filepath.parent.mkdir(parents=True, exist_ok=True)
-    filepath.write_text("\n".join(lines))
+def process_raw_chunk(raw_chunk: pd.DataFrame) -> tuple:
+    """Row hashes and missing counts of one raw chunk, plus its cleaned rows."""
+    row_hashes = pd.util.hash_pandas_object(raw_chunk, index=False)
+    missing = raw_chunk.isna().sum()
 
-    print(f"  Generated ETL report")
+    return row_hashes, missing, transform_chunk(raw_chunk)
 
 
-# =============================================================================
-# MAIN ETL PIPELINE
-# =============================================================================
+def process_raw_chunks_in_pool(
+    pool: ProcessPoolExecutor,
+    raw_chunks: Iterator[pd.DataFrame],
+    window: int,
+) -> Iterator[tuple]:
+    """
+    process_raw_chunk over the chunks in worker processes, in file order.
+
+    Unlike pool.map, which submits the whole iterator up front, at most
+    `window` chunks are in flight, so the file is read only as fast as the
+    workers clean it.
+    """
+    pending = deque()
+    for raw_chunk in raw_chunks:
+        pending.append(pool.submit(process_raw_chunk, raw_chunk))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
 
 
 def run_etl(
     raw_path: Path = RAW_DATA_PATH,
     processed_path: Path = PROCESSED_DATA_PATH,
+    parquet_path: Path = PROCESSED_PARQUET_PATH,
+    analysis_path: Path = ANALYSIS_PARQUET_PATH,
     dict_path: Path = DATA_DICTIONARY_PATH,
     report_path: Path = ETL_REPORT_PATH,
+    fast_io: bool = False,
+    workers: int = 1,
+    formats: tuple = ("csv", "parquet"),
+    verbose: bool = False,
 ) -> pd.DataFrame:
     """
     Run the complete ETL pipeline.
 
+    Args:
+        fast_io: Parse the raw CSV with pyarrow instead of pandas' reader
+        workers: Processes cleaning raw chunks in parallel; only worth it when
+            the file spans several CHUNK_SIZE chunks. The workers are spawned,
+            so a calling script needs an `if __name__ == "__main__":` guard
+        formats: Full-dataset outputs to write: "csv" (Tableau) and/or
+            "parquet"; the analysis subset Parquet is always written
+        verbose: Also print the cleaned value distributions and flag totals
+
     Returns:
         Cleaned DataFrame
     """
+    unknown = set(formats) - {"csv", "parquet"}
+    if unknown:
+        raise ValueError(f"Unknown output formats: {sorted(unknown)}")
+
     print("=" * 60)
     print("ETL PIPELINE: Social Media and Mental Health Dataset")
     print("=" * 60)
 
-    # Load raw data
-    df = load_raw_data(raw_path)
-    df_before = df.copy()
-    checks_before = run_quality_checks(df, stage="raw")
-
-    # Transform
-    df = rename_columns(df)
-    df = drop_timestamp(df)
-    df = clean_age(df)
-    df = clean_gender(df)
-    df = clean_yes_no(df)
-    df = parse_platforms(df)
-    df = parse_affiliations(df)
-    df = create_time_midpoint(df)
-    df = validate_likert_scales(df)
-    df = create_analysis_flag(df)
-    df = reorder_columns(df)
+    # Load and transform the raw CSV one chunk at a time; only row hashes and
+    # missing counts of the raw rows are kept for the before/after report.
+    # Chunks are independent, so with workers > 1 they are cleaned in parallel
+    # processes, at most two per worker in flight (results still arrive in
+    # file order). The next chunk is parsed on a background thread while the
+    # current one is cleaned. That thread (and pyarrow's) is running when the
+    # workers start, so they are spawned: a forked child could inherit a lock
+    # held by another thread and deadlock
+    raw_chunks = prefetch_chunks(load_raw_chunks(raw_path, fast_io=fast_io))
+    clean_chunks, raw_hashes, raw_missing = [], [], []
+    spawn = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=spawn) if workers > 1 else nullcontext() as pool:
+        results = (
+            process_raw_chunks_in_pool(pool, raw_chunks, window=2 * workers)
+            if pool else map(process_raw_chunk, raw_chunks)
+        )
+        for row_hashes, missing, clean_chunk in results:
+            raw_hashes.append(row_hashes)
+            raw_missing.append(missing)
+            clean_chunks.append(clean_chunk)
+
+    # Categories are set on the whole frame: per-chunk categories would differ
+    # and concat would fall back to object columns
+    df = categorise_columns(pd.concat(clean_chunks, ignore_index=True))
+    checks_before = run_raw_quality_checks(
+        pd.concat(raw_hashes),
+        pd.concat(raw_missing, axis=1).sum(axis=1),
+    )
 
     # Final quality checks
-    checks_after = run_quality_checks(df, stage="processed")
+    checks_after = run_quality_checks(df, stage="processed", verbose=verbose)
 
     # Save outputs
-    save_processed_data(df, processed_path)
+    if "csv" in formats:
+        save_processed_data(df, processed_path)
+    if "parquet" in formats:
+        save_processed_parquet(df, parquet_path)
+    save_analysis_parquet(df, analysis_path)
     generate_data_dictionary(df, dict_path)
-    generate_etl_report(df_before, df, checks_before, checks_after, report_path)
+    generate_etl_report(df, checks_before, checks_after, report_path)
 
     print("\n" + "=" * 60)
     print("ETL COMPLETE")
     print("=" * 60)
-    print(f"  Processed data: {processed_path}")
+    if "csv" in formats:
+        print(f"  Processed data: {processed_path}")
+    if "parquet" in formats:
+        print(f"  Parquet copy: {parquet_path}")
+    print(f"  Analysis subset: {analysis_path}")
     print(f"  Data dictionary: {dict_path}")
     print(f"  ETL report: {report_path}")
 
@@ -0,0 +1,36 @@
+"""
+Shared Chart Builders
+=====================
+
+Plotly figures drawn the same way on more than one page.
+"""
+
+import plotly.graph_objects as go
+
+
+def quartile_box_figure(df, group_col, value_col, colours):
+    """
+    Box plot per group from precomputed min/Q1/median/Q3/max.
+
+    Only these five numbers per group go to the browser, not the raw rows.
+    Groups with no rows are skipped; whiskers run to each group's min and max.
+    """
+    box_stats = (
+        df.groupby(group_col, observed=True)[value_col]
+        .quantile([0, 0.25, 0.5, 0.75, 1])
+        .unstack()
+    )
+
+    return go.Figure([
+        go.Box(
+            x=[group],
+            lowerfence=[row[0]],
+            q1=[row[0.25]],
+            median=[row[0.5]],
+            q3=[row[0.75]],
+            upperfence=[row[1]],
+            name=group,
+            marker_color=colour,
+        )
+        for (group, row), colour in zip(box_stats.iterrows(), colours)
+    ])
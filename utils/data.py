@@ -0,0 +1,114 @@
+"""
+Shared Data Loading
+===================
+
+One cached loader for the processed dataset, imported by every page so the
+Parquet file is parsed once per column set and held in memory once.
+"""
+
+import streamlit as st
+import numpy as np
+import pandas as pd
+from pathlib import Path
+
+from utils.frames import to_numpy_ints
+
+# Social media users only, written by src/etl.py
+DATA_PATH = Path("data/processed/v1/smmh_clean_included.parquet")
+
+TIME_ORDER = [
+    "Less than an Hour",
+    "Between 1 and 2 hours",
+    "Between 2 and 3 hours",
+    "Between 3 and 4 hours",
+    "Between 4 and 5 hours",
+    "More than 5 hours",
+]
+
+AGE_ORDER = ["<18", "18-24", "25-34", "35-44", "45+", "Unknown"]
+
+LIKERT_COLS = [
+    "purposeless_use",
+    "distracted_when_busy",
+    "restless_without_sm",
+    "easily_distracted",
+    "worries_bother",
+    "difficulty_concentrating",
+    "compare_to_successful",
+    "comparison_feelings",
+    "seek_validation",
+    "low_mood_freq",
+    "interest_fluctuation",
+    "sleep_issues",
+]
+
+PLATFORM_COLS = [
+    "platform_facebook",
+    "platform_twitter",
+    "platform_instagram",
+    "platform_youtube",
+    "platform_snapchat",
+    "platform_discord",
+    "platform_reddit",
+    "platform_pinterest",
+    "platform_tiktok",
+]
+
+# Compact numeric columns: 1-5 scores fit in int8, hours in float32
+NUMERIC_DTYPES = {
+    **dict.fromkeys(LIKERT_COLS, "int8"),
+    "daily_hours_midpoint": "float32",
+}
+
+# Categorical segments: integer codes instead of repeated strings
+CATEGORICAL_DTYPES = {
+    "daily_time_band": pd.CategoricalDtype(TIME_ORDER, ordered=True),
+    "age_band": pd.CategoricalDtype(AGE_ORDER, ordered=True),
+    "gender_grouped": "category",
+    "occupation_status": "category",
+}
+
+
+@st.cache_resource
+def get_df(columns=None):
+    """
+    Load the analysis rows of the cleaned dataset.
+
+    Every caller asking for the same columns gets the same DataFrame object,
+    so pages must treat it as read-only.
+    """
+    df = pd.read_parquet(
+        DATA_PATH,
+        engine="pyarrow",
+        columns=list(columns) if columns is not None else None,
+    )
+
+    df = to_numpy_ints(df)
+
+    # Downcast plain numpy columns only: a Likert column with a missing score
+    # is still nullable Int8, which a cast to int8 would reject
+    numeric = {
+        col: dtype for col, dtype in NUMERIC_DTYPES.items()
+        if col in df.columns and isinstance(df[col].dtype, np.dtype)
+    }
+    categorical = {col: dtype for col, dtype in CATEGORICAL_DTYPES.items() if col in df.columns}
+    return df.astype({**numeric, **categorical})
+
+
+def platform_totals(df, rows=None):
+    """
+    Users per platform, sorted ascending for the horizontal bar charts.
+
+    Pass row positions to count only those rows.
+    """
+    flags = df[PLATFORM_COLS].to_numpy()
+    if rows is not None:
+        flags = flags[rows]
+
+    # Signed totals from the uint8 flags: px only uses a continuous colour
+    # scale for signed/float values
+    users = pd.Series(
+        flags.sum(axis=0, dtype=np.int64),
+        index=[col.replace("platform_", "").title() for col in PLATFORM_COLS],
+    )
+    return users.sort_values()
@@ -0,0 +1,17 @@
+"""
+Shared DataFrame Helpers
+========================
+
+Plain pandas helpers used by both the Streamlit pages and the offline
+scripts (src/, run_eda.py), so nothing here may import Streamlit.
+"""
+
+
+def to_numpy_ints(df):
+    """Gap-free nullable integer columns back to plain numpy ints for scipy/statsmodels."""
+    complete = {
+        col: df[col].dtype.numpy_dtype
+        for col in df.select_dtypes(["Int8", "Int64"])
+        if df[col].notna().all()
+    }
+    return df.astype(complete)